@@ -69,6 +69,27 @@ async def add_transaction(account_id: str, transaction_data: TransactionCreate,
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/{account_id}/transactions/batch", response_model=List[Transaction])
+async def add_transactions(account_id: str, transactions_data: List[TransactionCreate], service: LedgerService = Depends(get_ledger_service)):
+    """Add several transactions to an account with a single save"""
+    try:
+        return service.add_transactions(account_id, [t.model_dump() for t in transactions_data])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+class TransactionBatchDelete(BaseModel):
+    ids: List[str]
+
+@router.post("/{account_id}/transactions/batch-delete")
+async def delete_transactions(account_id: str, delete_data: TransactionBatchDelete, service: LedgerService = Depends(get_ledger_service)):
+    """Delete several transactions from an account with a single save.
+    Responds with the ids that were removed; unknown ids are left out."""
+    try:
+        deleted_ids = service.delete_transactions(account_id, delete_data.ids)
+        return {"message": "Transactions deleted successfully", "deleted_ids": deleted_ids}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.delete("/{account_id}/transactions/{transaction_id}")
 async def delete_transaction(account_id: str, transaction_id: str, service: LedgerService = Depends(get_ledger_service)):
     """Delete a transaction from an account"""
@@ -188,6 +209,14 @@ async def add_valuation(account_id: str, valuation_data: ValuationCreate, servic
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/{account_id}/valuations/batch", response_model=List[ValuationRecord])
+async def add_valuations(account_id: str, valuations_data: List[ValuationCreate], service: LedgerService = Depends(get_ledger_service)):
+    """Add several valuations to an account with a single save"""
+    try:
+        return service.add_valuations(account_id, [v.model_dump() for v in valuations_data])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.delete("/{account_id}/valuations/{valuation_id}")
 async def delete_valuation(account_id: str, valuation_id: str, service: LedgerService = Depends(get_ledger_service)):
     """Delete a valuation from an account"""
@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Dict, Any, Optional
 from models.domain import Account
@@ -7,6 +9,9 @@ from core.repository import LedgerRepository
 
 router = APIRouter(prefix="/stats", tags=["statistics"])
 
+# 주식 계좌로 분류할 키워드 (계좌명/이미지 경로를 소문자로 바꿔 한 번에 검색)
+_STOCK_KEYWORDS_RE = re.compile("주식|증권|나무|한국투자|ibk|ok저축은행")
+
 # Dependency injection for service
 def get_ledger_service():
     database = JSONDatabase()
@@ -79,6 +84,23 @@ async def get_monthly_salary_totals(year: Optional[str] = None, person: Optional
     
     return {"monthly_totals": dict(sorted_totals)}
 
+@lru_cache(maxsize=256)
+def _categorize_investment(account_name: str, image_path: str) -> str:
+    """Classify an investment account by name or image path (memoized per pair)"""
+    account_name_lower = account_name.lower()
+    image_path_lower = image_path.lower()
+
+    # Check for pension accounts first
+    if "연금" in account_name:
+        return "연금"
+    if "부동산" in account_name_lower or "부동산" in image_path_lower:
+        return "부동산"
+    if "코인" in account_name:  # Include all accounts with "코인" in name
+        return "코인"
+    if _STOCK_KEYWORDS_RE.search(account_name_lower) or _STOCK_KEYWORDS_RE.search(image_path_lower):
+        return "주식"
+    return "기타"
+
 @router.get("/asset-allocation")
 async def get_asset_allocation(service: LedgerService = Depends(get_ledger_service)):
     """Calculate the total value for each asset category"""
@@ -103,21 +125,8 @@ async def get_asset_allocation(service: LedgerService = Depends(get_ledger_servi
             
             if investment_value > 0:
                 # Categorize investment accounts by name or image path
-                account_name = acc.name
-                account_name_lower = account_name.lower()
-                image_path_lower = acc.image_path.lower() if acc.image_path else ""
-                
-                # Check for pension accounts first
-                if "연금" in account_name:
-                    categories["연금"] += investment_value
-                elif "부동산" in account_name_lower or "부동산" in image_path_lower:
-                    categories["부동산"] += investment_value
-                elif "코인" in account_name:  # Include all accounts with "코인" in name
-                    categories["코인"] += investment_value
-                elif any(keyword in account_name_lower or keyword in image_path_lower for keyword in ["주식", "증권", "나무", "한국투자", "ibk", "ok저축은행"]):
-                    categories["주식"] += investment_value
-                else:
-                    categories["기타"] += investment_value
+                category = _categorize_investment(acc.name, acc.image_path or "")
+                categories[category] += investment_value
         else:
             # For non-investment accounts, add their balance to cash
             # BUT only include "현금" type accounts, not "소비" type accounts
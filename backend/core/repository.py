@@ -8,6 +8,18 @@ class LedgerRepository:
     def __init__(self, database: JSONDatabase):
         """Initialize with database"""
         self.db = database
+
+    def __enter__(self) -> "LedgerRepository":
+        """Batch mutations: the ledger file is written once when the block exits"""
+        self.db.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.db.__exit__(exc_type, exc_value, traceback)
+
+    def flush(self) -> None:
+        """Write any pending changes to storage"""
+        self.db.flush()
     
     def get_all_accounts(self) -> List[Account]:
         """Get all accounts"""
@@ -15,11 +27,7 @@ class LedgerRepository:
     
     def get_account(self, account_id: str) -> Optional[Account]:
         """Get account by ID"""
-        accounts = self.get_all_accounts()
-        for account in accounts:
-            if account.id == account_id:
-                return account
-        return None
+        return self.db.get_account(account_id)
     
     def save_account(self, account: Account) -> None:
         """Save an account"""
@@ -34,6 +42,17 @@ class LedgerRepository:
         account = self.get_account(account_id)
         if account:
             account.transactions.append(transaction)
+            account.invalidate_cache()
+            self.db.save_transaction(account, transaction)
+            return True
+        return False
+
+    def add_transactions(self, account_id: str, transactions: List[Transaction]) -> bool:
+        """Add several transactions to an account with a single save"""
+        account = self.get_account(account_id)
+        if account:
+            account.transactions.extend(transactions)
+            account.invalidate_cache()
             self.save_account(account)
             return True
         return False
@@ -45,24 +64,66 @@ class LedgerRepository:
             for i, t in enumerate(account.transactions):
                 if t.id == transaction.id:
                     account.transactions[i] = transaction
-                    self.save_account(account)
+                    account.invalidate_cache()
+                    self.db.save_transaction(account, transaction)
                     return True
         return False
+
+    def delete_transaction(self, account_id: str, transaction_id: str) -> bool:
+        """Delete transaction from account"""
+        account = self.get_account(account_id)
+        if account:
+            account.transactions = [t for t in account.transactions if t.id != transaction_id]
+            self.db.delete_transaction(account, transaction_id)
+            return True
+        return False
+
+    def delete_transactions(self, account_id: str, transaction_ids: List[str]) -> Optional[List[str]]:
+        """Delete several transactions from an account with a single filter pass and save.
+        Returns the removed ids in account order, or None if the account doesn't exist."""
+        account = self.get_account(account_id)
+        if not account:
+            return None
+        to_delete = set(transaction_ids)
+        kept, deleted_ids = [], []
+        for t in account.transactions:
+            if t.id in to_delete:
+                deleted_ids.append(t.id)
+            else:
+                kept.append(t)
+        if deleted_ids:
+            account.transactions = kept
+            self.db.delete_transactions(account, set(deleted_ids))
+        return deleted_ids
     
     def add_valuation(self, account_id: str, valuation: ValuationRecord) -> bool:
         """Add valuation to account"""
         account = self.get_account(account_id)
         if account:
-            account.valuations.append(valuation)
-            # Update compatibility fields using the new calculated value
-            account.evaluated_amount = account.calculated_evaluated_amount
-            if account.valuations:
-                latest = account.latest_valuation
-                if latest:
-                    account.last_valuation_date = latest.evaluation_date[:10]
+            account.add_valuation(valuation)
+            self._sync_valuation_fields(account)
             self.save_account(account)
             return True
         return False
+
+    def add_valuations(self, account_id: str, valuations: List[ValuationRecord]) -> bool:
+        """Add several valuations to an account with a single save"""
+        account = self.get_account(account_id)
+        if account:
+            for valuation in valuations:
+                account.add_valuation(valuation)
+            self._sync_valuation_fields(account)
+            self.save_account(account)
+            return True
+        return False
+
+    def _sync_valuation_fields(self, account: Account) -> None:
+        """Update compatibility fields using the new calculated value"""
+        account.evaluated_amount = account.calculated_evaluated_amount
+        if account.valuations:
+            latest = account.latest_valuation
+            if latest:
+                account.last_valuation_date = latest.evaluation_date[:10]
     
     def get_salaries(self) -> List[Dict[str, Any]]:
         """Get all salary data"""
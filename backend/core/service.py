@@ -1,18 +1,21 @@
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any, Literal, Sequence
 from datetime import datetime, timezone
-from collections import defaultdict
-from models.domain import Account, Transaction, ValuationRecord, TradePair
+from collections import defaultdict, deque
+from itertools import chain
+from models.domain import Account, Transaction, ValuationRecord, TradePair, gen_id, date_bisect
 from core.repository import LedgerRepository
 
-def gen_id() -> str:
-    """Generate a unique ID using UUID v4"""
-    import uuid
-    return str(uuid.uuid4())
-
 def today_iso() -> str:
     """Get current date/time in ISO format"""
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+def _validate_transaction(type_: str, amount: float) -> None:
+    """Check the fields add/update transaction accept; raises ValueError"""
+    if amount < 0:
+        raise ValueError("금액은 양수 값이어야 합니다.")
+    if type_ not in ("income", "expense"):
+        raise ValueError("거래 타입이 잘못되었습니다.")
+
 def format_currency(amount: float) -> str:
     """Format amount as currency string"""
     return f"₩{amount:,.0f}"
@@ -67,10 +70,7 @@ class LedgerService:
     def add_transaction(self, account_id: str, type_: Literal["income", "expense"],
                        amount: float, category: str, memo: str, date: str) -> Transaction:
         """Add a new transaction"""
-        if amount < 0:
-            raise ValueError("금액은 양수 값이어야 합니다.")
-        if type_ not in ("income", "expense"):
-            raise ValueError("거래 타입이 잘못되었습니다.")
+        _validate_transaction(type_, amount)
         
         transaction = Transaction(
             account_id=account_id,
@@ -83,27 +83,25 @@ class LedgerService:
         self.repo.add_transaction(account_id, transaction)
         return transaction
 
+    def add_transactions(self, account_id: str, entries: List[Dict[str, Any]]) -> List[Transaction]:
+        """Add several transactions at once, saving the ledger a single time.
+        Each entry holds add_transaction's fields: type, amount, category, memo, date."""
+        transactions = []
+        for entry in entries:
+            _validate_transaction(entry["type"], entry["amount"])
+            transactions.append(Transaction(account_id=account_id, **entry))
+        if not self.repo.add_transactions(account_id, transactions):
+            raise ValueError("계좌를 찾을 수 없습니다.")
+        return transactions
+
     def update_transaction(self, account_id: str, transaction_id: str, type_: Literal["income", "expense"],
                           amount: float, category: str, memo: str, date: str) -> Transaction:
         """Update an existing transaction"""
-        if amount < 0:
-            raise ValueError("금액은 양수 값이어야 합니다.")
-        if type_ not in ("income", "expense"):
-            raise ValueError("거래 타입이 잘못되었습니다.")
+        _validate_transaction(type_, amount)
         
-        # Helper to find existing transaction to preserve ID and other fields if needed
         account = self.repo.get_account(account_id)
         if not account:
             raise ValueError("계좌를 찾을 수 없습니다.")
-        
-        existing_transaction = None
-        for t in account.transactions:
-            if t.id == transaction_id:
-                existing_transaction = t
-                break
-        
-        if not existing_transaction:
-            raise ValueError("거래 내역을 찾을 수 없습니다.")
 
         updated_transaction = Transaction(
             id=transaction_id,
@@ -114,18 +112,24 @@ class LedgerService:
             memo=memo,
             date=date
         )
-        self.repo.update_transaction(account_id, updated_transaction)
+        # The repository finds the record by id in its own pass; no separate lookup scan here
+        if not self.repo.update_transaction(account_id, updated_transaction):
+            raise ValueError("거래 내역을 찾을 수 없습니다.")
         return updated_transaction
 
     def delete_transaction(self, account_id: str, transaction_id: str) -> None:
         """Delete a transaction"""
-        account = self.repo.get_account(account_id)
-        if not account:
-            raise ValueError("계좌를 찾을 수 없습니다.")
-        
         # Remove the transaction from the account's transactions list
-        account.transactions = [t for t in account.transactions if t.id != transaction_id]
-        self.repo.save_account(account)
+        if not self.repo.delete_transaction(account_id, transaction_id):
+            raise ValueError("계좌를 찾을 수 없습니다.")
+
+    def delete_transactions(self, account_id: str, transaction_ids: List[str]) -> List[str]:
+        """Delete several transactions at once. Returns the ids that were actually removed;
+        ids not found on the account are ignored."""
+        deleted_ids = self.repo.delete_transactions(account_id, transaction_ids)
+        if deleted_ids is None:
+            raise ValueError("계좌를 찾을 수 없습니다.")
+        return deleted_ids
 
     def list_transactions(self, account_id: str, ascending: bool = False) -> List[Transaction]:
         """Get transactions for an account, sorted by date"""
@@ -136,10 +140,15 @@ class LedgerService:
 
     def month_summary(self, account_id: str, year_month: str) -> Dict[str, float]:
         """Get income/expense summary for a specific month"""
-        txns = self.list_transactions(account_id)
-        income = sum(t.amount for t in txns if t.type == "income" and t.date.startswith(year_month))
-        expense = sum(t.amount for t in txns if t.type == "expense" and t.date.startswith(year_month))
-        return {"income": income, "expense": expense}
+        totals = {"income": 0, "expense": 0}
+        account = self.repo.get_account(account_id)
+        if not account:
+            return totals
+        # Order doesn't matter for sums, so skip list_transactions' sort
+        for t in account.transactions:
+            if t.date.startswith(year_month):
+                totals[t.type] += t.amount
+        return totals
 
     def total_assets(self) -> float:
         """Calculate total assets (excluding consumption accounts)"""
@@ -213,24 +222,37 @@ class LedgerService:
 
     def monthly_income_breakdown(self, year: Optional[str] = None) -> Dict[str, Dict]:
         """Returns monthly income breakdown (savings, interest, expense), optionally filtered by year."""
-        monthly_data = defaultdict(lambda: {"savings": 0, "interest": 0, "expense": 0})
+        # One flat counter per field; months with no matching transaction stay absent
+        savings = defaultdict(int)
+        interest = defaultdict(int)
+        expense = defaultdict(int)
         
-        for account in self.list_accounts():
-            if account.type != "현금":
+        # Stream the cash accounts' transactions as one flat sequence
+        cash_transactions = chain.from_iterable(
+            account.transactions for account in self.list_accounts() if account.type == "현금"
+        )
+        for txn in cash_transactions:
+            # Filter on the raw date before slicing so skipped years cost no allocation
+            if year and not txn.date.startswith(year):
                 continue
-            for txn in account.transactions:
-                year_month = txn.date[:7]  # YYYY-MM
-                if year and not year_month.startswith(year):
-                    continue
-                if txn.type == "income":
-                    if txn.category == "저축":
-                        monthly_data[year_month]["savings"] += txn.amount
-                    elif txn.category == "이자":
-                        monthly_data[year_month]["interest"] += txn.amount
-                elif txn.type == "expense" and txn.category == "지출":
-                    monthly_data[year_month]["expense"] += txn.amount
+            year_month = txn.date[:7]  # YYYY-MM
+            if txn.type == "income":
+                if txn.category == "저축":
+                    savings[year_month] += txn.amount
+                elif txn.category == "이자":
+                    interest[year_month] += txn.amount
+            elif txn.type == "expense" and txn.category == "지출":
+                expense[year_month] += txn.amount
         
-        return dict(sorted(monthly_data.items()))
+        months = sorted(savings.keys() | interest.keys() | expense.keys())
+        return {
+            month: {
+                "savings": savings.get(month, 0),
+                "interest": interest.get(month, 0),
+                "expense": expense.get(month, 0),
+            }
+            for month in months
+        }
 
     def add_valuation(self, account_id: str, amount: float, date: str, memo: str = "", transaction_type: Literal["buy", "sell", "valuation"] = "valuation") -> ValuationRecord:
         """투자 계좌에 새로운 평가 기록 추가"""
@@ -250,12 +272,30 @@ class LedgerService:
         self.repo.add_valuation(account_id, valuation)
         return valuation
     
-    def get_valuations(self, account_id: str) -> List[ValuationRecord]:
-        """계좌의 모든 평가 기록 반환 (날짜순 정렬)"""
+    def _valuations_view(self, account_id: str) -> Sequence[ValuationRecord]:
+        """계좌의 평가 기록 (날짜순) - 복사하지 않으므로 읽기 전용으로만 사용"""
         account = self.get_account(account_id)
         if not account:
-            return []
-        return sorted(account.valuations, key=lambda v: v.evaluation_date)
+            return ()
+        return account.valuations
+
+    def add_valuations(self, account_id: str, entries: List[Dict[str, Any]]) -> List[ValuationRecord]:
+        """투자 계좌에 여러 평가 기록을 한 번에 추가 (저장은 한 번)
+        Each entry holds ValuationRecord fields: evaluated_amount, evaluation_date, memo, transaction_type."""
+        account = self.get_account(account_id)
+        if not account:
+            raise ValueError("Account not found")
+        if account.type != "투자":
+            raise ValueError("Valuation is only available for investment accounts")
+        
+        valuations = [ValuationRecord(account_id=account_id, **entry) for entry in entries]
+        self.repo.add_valuations(account_id, valuations)
+        return valuations
+    
+    def get_valuations(self, account_id: str) -> List[ValuationRecord]:
+        """계좌의 모든 평가 기록 반환 (날짜순 정렬)"""
+        # Account keeps valuations in date order; return a copy so callers can't reorder it
+        return list(self._valuations_view(account_id))
     
     def delete_valuation(self, account_id: str, valuation_id: str) -> None:
         """특정 평가 기록 삭제"""
@@ -276,21 +316,19 @@ class LedgerService:
     
     def get_valuation_history(self, account_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[ValuationRecord]:
         """특정 기간의 평가 기록 반환"""
-        valuations = self.get_valuations(account_id)
-        
-        if start_date:
-            valuations = [v for v in valuations if v.evaluation_date >= start_date]
-        if end_date:
-            valuations = [v for v in valuations if v.evaluation_date <= end_date]
-            
-        return valuations
+        valuations = self._valuations_view(account_id)
+        # Valuations are kept in date order, so the period is a contiguous slice found by binary search
+        lo = date_bisect(valuations, start_date, right=False) if start_date else 0
+        hi = date_bisect(valuations, end_date, right=True) if end_date else len(valuations)
+        return list(valuations[lo:hi])
     
     def get_trade_pairs(self, account_id: str) -> List[TradePair]:
         """계좌의 매수/매도 쌍 반환 - 단순화된 동적 페어링 로직"""
-        valuations = self.get_valuations(account_id)
+        valuations = self._valuations_view(account_id)
         
-        pairs = []
-        unpaired_buys = []  # 페어링되지 않은 buy 기록들
+        # 삽입 순서를 유지하는 dict: valuation 페어는 buy id, sell 페어는 sell id를 키로 사용
+        pairs: Dict[str, TradePair] = {}
+        unpaired_buys = deque()  # 페어링되지 않은 buy 기록들
         
         for valuation in valuations:
             if valuation.transaction_type == "buy":
@@ -300,27 +338,15 @@ class LedgerService:
             elif valuation.transaction_type == "sell":
                 # sell 기록이면 가장 오래된 unpaired buy와 페어링
                 if unpaired_buys:
-                    buy_val = unpaired_buys.pop(0)  # 가장 오래된 buy
-                    pair = TradePair(buy_valuation=buy_val, sell_valuation=valuation)
-                    pairs.append(pair)
+                    buy_val = unpaired_buys.popleft()  # 가장 오래된 buy
+                    pairs[valuation.id] = TradePair(buy_valuation=buy_val, sell_valuation=valuation)
                     
             elif valuation.transaction_type == "valuation":
                 # valuation 기록이면 가장 오래된 unpaired buy와 페어링
                 if unpaired_buys:
-                    # 이 buy가 이미 다른 valuation과 페어링되었는지 확인
                     buy_val = unpaired_buys[0]
-                    
-                    # 이미 pairs에 이 buy가 포함된 pair가 있는지 확인
-                    existing_pair_with_buy = None
-                    for pair in pairs:
-                        if pair.buy_valuation.id == buy_val.id:
-                            existing_pair_with_buy = pair
-                            break
-                    
-                    if existing_pair_with_buy:
-                        # 기존에 valuation과 페어링된 pair가 있으면 제거
-                        pairs.remove(existing_pair_with_buy)
-                    
-                    # 새로운 valuation과 페어링
-                    pair = TradePair(buy_valuation=buy_val, sell_valuation=valuation)
-                    pairs.append(pair)
+                    # 이 buy와 이미 페어링된 valuation이 있으면 제거하고 새 페어를 맨 뒤에 추가
+                    pairs.pop(buy_val.id, None)
+                    pairs[buy_val.id] = TradePair(buy_valuation=buy_val, sell_valuation=valuation)
+        
+        return list(pairs.values())
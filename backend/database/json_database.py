@@ -1,7 +1,16 @@
-import json
-from typing import List, Dict, Any, Optional
+import os
+from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
+from pydantic import TypeAdapter
 from models.domain import Account, Transaction, ValuationRecord, TradePair
+from utils.serialization import dumps, loads
+
+# Validate whole record lists in one pydantic-core call instead of Model(**d) per record
+_transactions_adapter = TypeAdapter(List[Transaction])
+_valuations_adapter = TypeAdapter(List[ValuationRecord])
+
+class LedgerIOError(Exception):
+    """Raised when the ledger file cannot be read or written"""
 
 class JSONDatabase:
     """JSON file-based database implementation"""
@@ -9,7 +18,21 @@ class JSONDatabase:
     def __init__(self, filepath: str = "data/ledger.json"):
         """Initialize with path to JSON file"""
         self.filepath = Path(filepath)
+        self._dirty = False
+        self._batch_depth = 0
+        # Account models built from self.data, by id; kept in step by save/delete_account
+        self._accounts: Dict[str, Account] = {}
         self.data = self._load_data()
+
+    def __enter__(self) -> "JSONDatabase":
+        """Start a batch: saves are deferred until the outermost block exits"""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
     
     def _load_data(self) -> Dict[str, Any]:
         """Load data from JSON file"""
@@ -20,56 +43,79 @@ class JSONDatabase:
             return default_data
         
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return loads(self.filepath.read_bytes())
         except Exception as e:
-            print(f"Warning: Failed to load data from {self.filepath}: {str(e)}")
-            return {"accounts": [], "salaries": []}
+            # Don't fall back to an empty ledger: the next save would overwrite the real file
+            raise LedgerIOError(f"Failed to load data from {self.filepath}: {str(e)}") from e
     
     def _save_data(self, data: Dict[str, Any]) -> None:
-        """Save data to JSON file"""
+        """Mark data as changed and write it, unless a batch is open"""
+        self.data = data
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to the JSON file.
+        Data goes to a temporary file first, is fsynced and swapped in with
+        os.replace, so an interrupted write never leaves a truncated ledger behind."""
+        if not self._dirty:
+            return
         try:
             # Create directory if it doesn't exist
             self.filepath.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp_path = self.filepath.with_name(self.filepath.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps(self.data))
+                f.flush()
+                # Make sure the bytes are on disk before the rename makes them visible
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+            self._dirty = False
         except Exception as e:
-            print(f"Error: Failed to save data to {self.filepath}: {str(e)}")
-            raise
+            raise LedgerIOError(f"Failed to save data to {self.filepath}: {str(e)}") from e
     
+    def _build_account(self, acc_dict: Dict[str, Any]) -> Account:
+        """Convert a stored account dict to an Account, reusing one already built"""
+        account = self._accounts.get(acc_dict["id"])
+        if account is not None:
+            return account
+
+        # Convert transactions
+        transactions = _transactions_adapter.validate_python(acc_dict.get("transactions", []))
+        
+        # Convert valuations
+        valuations = _valuations_adapter.validate_python(acc_dict.get("valuations", []))
+        
+        # Create account with all data
+        account = Account(
+            id=acc_dict["id"],
+            name=acc_dict["name"],
+            type=acc_dict.get("type", "현금"),
+            status=acc_dict.get("status", "active"),
+            color=acc_dict["color"],
+            opening_balance=acc_dict["opening_balance"],
+            image_path=acc_dict.get("image_path", ""),
+            purchase_amount=acc_dict.get("purchase_amount", 0.0),
+            evaluated_amount=acc_dict.get("evaluated_amount", 0.0),
+            last_valuation_date=acc_dict.get("last_valuation_date", ""),
+            transactions=transactions,
+            valuations=valuations
+        )
+        self._accounts[account.id] = account
+        return account
+
     def get_all_accounts(self) -> List[Account]:
         """Get all accounts from database"""
-        accounts = []
+        return [self._build_account(acc_dict) for acc_dict in self.data.get("accounts", [])]
+
+    def get_account(self, account_id: str) -> Optional[Account]:
+        """Get a single account by ID without building the others"""
         for acc_dict in self.data.get("accounts", []):
-            # Convert transactions
-            transactions = [
-                Transaction(**t) for t in acc_dict.get("transactions", [])
-            ]
-            
-            # Convert valuations
-            valuations = [
-                ValuationRecord(**v) for v in acc_dict.get("valuations", [])
-            ]
-            
-            # Create account with all data
-            account = Account(
-                id=acc_dict["id"],
-                name=acc_dict["name"],
-                type=acc_dict.get("type", "현금"),
-                status=acc_dict.get("status", "active"),
-                color=acc_dict["color"],
-                opening_balance=acc_dict["opening_balance"],
-                image_path=acc_dict.get("image_path", ""),
-                purchase_amount=acc_dict.get("purchase_amount", 0.0),
-                evaluated_amount=acc_dict.get("evaluated_amount", 0.0),
-                last_valuation_date=acc_dict.get("last_valuation_date", ""),
-                transactions=transactions,
-                valuations=valuations
-            )
-            accounts.append(account)
-        
-        return accounts
+            if acc_dict["id"] == account_id:
+                return self._build_account(acc_dict)
+        return None
  
     def get_salaries(self) -> List[Dict[str, Any]]:
         """Get all salary data"""
@@ -113,6 +159,7 @@ class JSONDatabase:
         
         # Convert account to dictionary
         account_dict = account.dict()
+        self._accounts[account.id] = account
         
         # Check if account already exists
         for i, acc in enumerate(accounts):
@@ -126,6 +173,51 @@ class JSONDatabase:
         self.data["accounts"] = accounts
         self._save_data(self.data)
 
+    def _find_account_dict(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """Stored dict of an account, or None"""
+        for acc_dict in self.data.get("accounts", []):
+            if acc_dict["id"] == account_id:
+                return acc_dict
+        return None
+
+    def save_transaction(self, account: Account, transaction: Transaction) -> None:
+        """Save one added or edited transaction of an account.
+        Only that record is serialized and patched into the stored account, instead of
+        re-dumping every transaction and valuation the way save_account does."""
+        acc_dict = self._find_account_dict(account.id)
+        if acc_dict is None:
+            self.save_account(account)
+            return
+
+        txn_dict = transaction.model_dump()
+        stored = acc_dict.setdefault("transactions", [])
+        for i, t in enumerate(stored):
+            if t["id"] == transaction.id:
+                stored[i] = txn_dict
+                break
+        else:
+            stored.append(txn_dict)
+        # Balance-derived value stored next to the account
+        acc_dict["asset_value"] = account.asset_value
+        self._accounts[account.id] = account
+        self._save_data(self.data)
+
+    def delete_transaction(self, account: Account, transaction_id: str) -> None:
+        """Remove one transaction from the stored account"""
+        self.delete_transactions(account, {transaction_id})
+
+    def delete_transactions(self, account: Account, transaction_ids: Set[str]) -> None:
+        """Remove several transactions from the stored account in one pass"""
+        acc_dict = self._find_account_dict(account.id)
+        if acc_dict is None:
+            self.save_account(account)
+            return
+
+        acc_dict["transactions"] = [t for t in acc_dict.get("transactions", []) if t["id"] not in transaction_ids]
+        acc_dict["asset_value"] = account.asset_value
+        self._accounts[account.id] = account
+        self._save_data(self.data)
+
     def delete_account(self, account_id: str) -> bool:
         """Delete an account"""
         accounts = self.data.get("accounts", [])
@@ -135,6 +227,7 @@ class JSONDatabase:
         
         if len(accounts) < initial_len:
             self.data["accounts"] = accounts
+            self._accounts.pop(account_id, None)
             self._save_data(self.data)
             return True
         return False
@@ -1,5 +1,7 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from database.json_database import LedgerIOError
 
 app = FastAPI(
     title="Money Report API",
@@ -16,6 +18,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(LedgerIOError)
+async def ledger_io_error_handler(request: Request, exc: LedgerIOError):
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
 @app.get("/")
 async def root():
     return {"message": "Money Report API"}
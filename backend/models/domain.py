@@ -1,11 +1,15 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Literal
+from pydantic import BaseModel, Field, PrivateAttr, validator
+from typing import List, Optional, Literal, Dict, Any, Sequence
 from datetime import datetime
-from uuid import uuid4
+import os
+
+# Sign applied to a transaction amount when accumulating an account balance
+TRANSACTION_SIGN = {"income": 1, "expense": -1}
 
 def gen_id() -> str:
-    """Generate a unique ID using UUID v4"""
-    return str(uuid4())
+    """Generate a unique ID (32 random hex characters).
+    Existing dashed UUID v4 IDs stay valid; IDs are only ever compared as opaque strings."""
+    return os.urandom(16).hex()
 
 class Transaction(BaseModel):
     """Represents a financial transaction with an account"""
@@ -64,6 +68,36 @@ class TradePair(BaseModel):
         """수익금액 계산"""
         return self.sell_valuation.evaluated_amount - self.buy_valuation.evaluated_amount
 
+def date_bisect(valuations: Sequence[ValuationRecord], date: str, right: bool) -> int:
+    """Index of the first valuation dated after `date` (right) or not before it (left).
+    `valuations` must be sorted by evaluation_date; ISO8601 strings compare lexicographically."""
+    lo, hi = 0, len(valuations)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        d = valuations[mid].evaluation_date
+        if d < date or (right and d == date):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _track_valuation(extremes: tuple, v: ValuationRecord) -> tuple:
+    """Fold one valuation into (latest, first_buy, last_sell).
+    ISO8601 dates compare lexicographically; ties keep the earlier record like min()/max()."""
+    latest, first_buy, last_sell = extremes
+    if latest is None or v.evaluation_date > latest.evaluation_date:
+        latest = v
+    if v.transaction_type == "buy":
+        if first_buy is None or v.evaluation_date < first_buy.evaluation_date:
+            first_buy = v
+    elif v.transaction_type == "sell":
+        if last_sell is None or v.evaluation_date > last_sell.evaluation_date:
+            last_sell = v
+    return latest, first_buy, last_sell
+
+# Account fields the memoized values are derived from
+_CACHE_INPUTS = frozenset({"transactions", "valuations", "opening_balance", "type"})
+
 class Account(BaseModel):
     """Account information model"""
     id: str = Field(default_factory=gen_id)
@@ -79,13 +113,42 @@ class Account(BaseModel):
     purchase_amount: float = 0.0 # 총 매입금액
     evaluated_amount: float = 0.0 # 현재 평가금액 (호환성 유지)
     last_valuation_date: str = "" # 마지막 평가 날짜 (YYYY-MM-DD) (호환성 유지)
+    # Memoized derived values (balance, valuation extremes, evaluated amount);
+    # cleared when one of _CACHE_INPUTS is reassigned
+    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Writing output fields (evaluated_amount, last_valuation_date, ...) keeps the cache
+        if name in _CACHE_INPUTS:
+            self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop memoized values. Call after mutating transactions/valuations in place."""
+        self._cache.clear()
+
+    def add_valuation(self, valuation: ValuationRecord) -> None:
+        """평가 기록 추가 - 최신/첫 매수/마지막 매도 기록은 다시 스캔하지 않고 갱신"""
+        extremes = self._cache.get("valuation_extremes")
+        # valuations are kept in date order; insert after any same-date records
+        self.valuations.insert(date_bisect(self.valuations, valuation.evaluation_date, right=True), valuation)
+        self.invalidate_cache()
+        if extremes is not None:
+            self._cache["valuation_extremes"] = _track_valuation(extremes, valuation)
+
+    def _valuation_extremes(self) -> tuple:
+        """(latest, first_buy, last_sell) valuations, computed in one pass and memoized"""
+        if "valuation_extremes" not in self._cache:
+            extremes = (None, None, None)
+            for v in self.valuations:
+                extremes = _track_valuation(extremes, v)
+            self._cache["valuation_extremes"] = extremes
+        return self._cache["valuation_extremes"]
 
     @property
     def latest_valuation(self) -> Optional[ValuationRecord]:
         """가장 최신 평가 기록 반환"""
-        if not self.valuations:
-            return None
-        return max(self.valuations, key=lambda v: v.evaluation_date)
+        return self._valuation_extremes()[0]
     
     @property
     def return_rate(self) -> float:
@@ -93,13 +156,9 @@ class Account(BaseModel):
         if self.type == "투자" and self.valuations:
             # 부동산 계좌인 경우: 첫 buy 거래와 마지막 sell 거래로 수익률 계산
             if "부동산" in self.name:
-                buy_valuations = [v for v in self.valuations if v.transaction_type == "buy"]
-                sell_valuations = [v for v in self.valuations if v.transaction_type == "sell"]
+                _, first_buy, last_sell = self._valuation_extremes()
                 
-                if buy_valuations and sell_valuations:
-                    first_buy = min(buy_valuations, key=lambda v: v.evaluation_date)
-                    last_sell = max(sell_valuations, key=lambda v: v.evaluation_date)
-                    
+                if first_buy is not None and last_sell is not None:
                     buy_amount = first_buy.evaluated_amount
                     sell_amount = last_sell.evaluated_amount
                     
@@ -119,12 +178,18 @@ class Account(BaseModel):
     def calculated_evaluated_amount(self) -> float:
         """Calculate evaluated amount based on transaction types and dates.
         For buy transactions, accumulate all buy amounts after the last sell.
-        For sell/valuation transactions, use the latest transaction amount."""
+        For sell/valuation transactions, use the latest transaction amount.
+        Memoized: asset_value, dict() and the compatibility fields all read it."""
+        if "evaluated_amount" not in self._cache:
+            self._cache["evaluated_amount"] = self._evaluate_valuations()
+        return self._cache["evaluated_amount"]
+
+    def _evaluate_valuations(self) -> float:
         if not self.valuations:
             return 0.0
         
-        # Sort valuations by date
-        sorted_valuations = sorted(self.valuations, key=lambda v: v.evaluation_date)
+        # valuations are already in date order (see sort_valuations_by_date)
+        sorted_valuations = self.valuations
         latest_valuation = sorted_valuations[-1]
         
         # If the latest transaction is sell or valuation, use its amount directly
@@ -161,9 +226,12 @@ class Account(BaseModel):
         """Calculate current account balance including all transactions.
         Kept for compatibility with non-investment accounts.
         """
-        income = sum(t.amount for t in self.transactions if t.type == "income")
-        expense = sum(t.amount for t in self.transactions if t.type == "expense")
-        return self.opening_balance + income - expense
+        if "balance" not in self._cache:
+            total = self.opening_balance
+            for t in self.transactions:
+                total += TRANSACTION_SIGN[t.type] * t.amount
+            self._cache["balance"] = total
+        return self._cache["balance"]
 
     @validator('name')
     def name_cannot_be_empty(cls, v):
@@ -177,6 +245,10 @@ class Account(BaseModel):
             raise ValueError('Invalid account type')
         return v
 
+    @validator('valuations')
+    def sort_valuations_by_date(cls, v):
+        return sorted(v, key=lambda r: r.evaluation_date)
+
     @validator('color')
     def color_must_be_valid_hex(cls, v):
         if not v.startswith("#") or len(v) != 7:
@@ -185,7 +257,9 @@ class Account(BaseModel):
     
     def dict(self, **kwargs):
         """Override dict() to include computed properties"""
-        data = super().dict(**kwargs)
+        # model_dump serializes nested transactions/valuations natively;
+        # BaseModel.dict() is only a deprecated wrapper around it in pydantic v2
+        data = self.model_dump(**kwargs)
         # Add computed properties to the dictionary
         data['return_rate'] = self.return_rate
         data['asset_value'] = self.asset_value
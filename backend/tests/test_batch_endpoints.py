@@ -0,0 +1,117 @@
+"""Batch transaction/valuation endpoints.
+Run from backend/: python -m unittest discover -s tests"""
+import asyncio
+import os
+import tempfile
+import unittest
+
+from fastapi import HTTPException
+
+from api.accounts import (
+    TransactionBatchDelete,
+    TransactionCreate,
+    ValuationCreate,
+    add_transactions,
+    add_valuations,
+    delete_transactions,
+)
+from core.repository import LedgerRepository
+from core.service import LedgerService
+from database.json_database import JSONDatabase
+
+
+class BatchEndpointsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "ledger.json")
+        service = self.service()
+        self.cash = service.add_account("민규 현금", "현금", "#123456", 1000.0)
+        self.invest = service.add_account("민규 주식", "투자", "#654321", 0.0)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def service(self):
+        """A fresh service reading the ledger file, like one API request"""
+        return LedgerService(LedgerRepository(JSONDatabase(self.path)))
+
+    def test_add_transactions_keeps_request_order(self):
+        entries = [
+            TransactionCreate(type="income", amount=300.0, category="급여", date="2024-03-01T00:00:00Z"),
+            TransactionCreate(type="expense", amount=50.0, category="식비", date="2024-01-01T00:00:00Z"),
+            TransactionCreate(type="income", amount=20.0, category="이자", date="2024-02-01T00:00:00Z"),
+        ]
+        created = asyncio.run(add_transactions(self.cash.id, entries, self.service()))
+
+        stored = self.service().get_account(self.cash.id)
+        self.assertEqual([t.id for t in stored.transactions], [t.id for t in created])
+        self.assertEqual([t.amount for t in stored.transactions], [300.0, 50.0, 20.0])
+        self.assertEqual(stored.balance(), 1270.0)
+
+    def test_add_transactions_rejects_whole_batch_on_invalid_entry(self):
+        entries = [
+            TransactionCreate(type="income", amount=300.0, category="급여", date="2024-03-01T00:00:00Z"),
+            TransactionCreate(type="expense", amount=-5.0, category="식비", date="2024-03-02T00:00:00Z"),
+        ]
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(add_transactions(self.cash.id, entries, self.service()))
+
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(self.service().get_account(self.cash.id).transactions, [])
+
+    def test_add_valuations_stored_in_date_order(self):
+        entries = [
+            ValuationCreate(evaluated_amount=300.0, evaluation_date="2024-03-01T00:00:00Z"),
+            ValuationCreate(evaluated_amount=100.0, evaluation_date="2024-01-01T00:00:00Z", transaction_type="buy"),
+            ValuationCreate(evaluated_amount=200.0, evaluation_date="2024-02-01T00:00:00Z"),
+        ]
+        asyncio.run(add_valuations(self.invest.id, entries, self.service()))
+
+        stored = self.service().get_account(self.invest.id)
+        self.assertEqual([v.evaluated_amount for v in stored.valuations], [100.0, 200.0, 300.0])
+        self.assertEqual(stored.evaluated_amount, 300.0)
+        self.assertEqual(stored.last_valuation_date, "2024-03-01")
+
+    def test_add_valuations_rejects_non_investment_account(self):
+        entries = [ValuationCreate(evaluated_amount=100.0, evaluation_date="2024-01-01T00:00:00Z")]
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(add_valuations(self.cash.id, entries, self.service()))
+
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(self.service().get_account(self.cash.id).valuations, [])
+
+    def test_delete_transactions_reports_only_removed_ids(self):
+        created = self.service().add_transactions(self.cash.id, [
+            {"type": "income", "amount": 10.0, "category": "a", "memo": "", "date": "2024-01-01T00:00:00Z"},
+            {"type": "income", "amount": 20.0, "category": "b", "memo": "", "date": "2024-01-02T00:00:00Z"},
+            {"type": "expense", "amount": 5.0, "category": "c", "memo": "", "date": "2024-01-03T00:00:00Z"},
+        ])
+        request = TransactionBatchDelete(ids=[created[2].id, "missing-id", created[0].id])
+        result = asyncio.run(delete_transactions(self.cash.id, request, self.service()))
+
+        self.assertEqual(result["deleted_ids"], [created[0].id, created[2].id])
+        stored = self.service().get_account(self.cash.id)
+        self.assertEqual([t.id for t in stored.transactions], [created[1].id])
+        self.assertEqual(stored.balance(), 1020.0)
+
+    def test_delete_transactions_with_only_unknown_ids(self):
+        request = TransactionBatchDelete(ids=["missing-id"])
+        result = asyncio.run(delete_transactions(self.cash.id, request, self.service()))
+        self.assertEqual(result["deleted_ids"], [])
+
+    def test_add_transactions_unknown_account(self):
+        entries = [TransactionCreate(type="income", amount=10.0, category="a", date="2024-01-01T00:00:00Z")]
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(add_transactions("missing-account", entries, self.service()))
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(self.service().get_account(self.cash.id).transactions, [])
+
+    def test_delete_transactions_unknown_account(self):
+        request = TransactionBatchDelete(ids=["missing-id"])
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(delete_transactions("missing-account", request, self.service()))
+        self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,15 @@
-import React, { useState } from 'react';
+import React, { useState, Suspense, lazy } from 'react';
 import styled from 'styled-components';
 import { Routes, Route } from 'react-router-dom';
 import AccountList from './components/AccountList';
-import AccountDetail from './components/AccountDetail';
-import Stats from './components/Stats';
 import AddAccountModal from './components/AddAccountModal';
 import AddSalaryModal from './components/AddSalaryModal';
 
+// The detail and stats pages pull in chart.js; load them (and it) on first visit
+// so the account list doesn't pay for the charting bundle up front
+const AccountDetail = lazy(() => import('./components/AccountDetail'));
+const Stats = lazy(() => import('./components/Stats'));
+
 const AppContainer = styled.div`
   max-width: 1200px;
   margin: 0 auto;
@@ -113,14 +116,15 @@ function App() {
     setIsAddSalaryModalOpen(true);
   };
 
+  // Notify only the views that show the changed data instead of reloading the whole page
   const handleAccountAdded = () => {
     // Refresh the account list
-    window.location.reload();
+    window.dispatchEvent(new CustomEvent('accountsChanged'));
   };
 
   const handleSalaryAdded = () => {
     // Refresh the stats page if it's currently open
-    window.location.reload();
+    window.dispatchEvent(new CustomEvent('salariesChanged'));
   };
 
   return (
@@ -138,11 +142,13 @@ function App() {
         <a href="/stats">통계</a>
       </Navigation>
 
-      <Routes>
-        <Route path="/" element={<AccountList />} />
-        <Route path="/account/:id" element={<AccountDetail />} />
-        <Route path="/stats" element={<Stats />} />
-      </Routes>
+      <Suspense fallback={<div>Loading...</div>}>
+        <Routes>
+          <Route path="/" element={<AccountList />} />
+          <Route path="/account/:id" element={<AccountDetail />} />
+          <Route path="/stats" element={<Stats />} />
+        </Routes>
+      </Suspense>
 
       <AddAccountModal
         isOpen={isAddAccountModalOpen}
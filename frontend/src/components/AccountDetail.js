@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, useMemo, useCallback } from 'react';
 import { useParams } from 'react-router-dom';
 import styled from 'styled-components';
 import { Line } from 'react-chartjs-2';
@@ -11,8 +11,10 @@ import {
   Title,
   Tooltip,
   Legend,
-  Filler
+  Filler,
+  Interaction
 } from 'chart.js';
+import { getRelativePosition } from 'chart.js/helpers';
 import ChartDataLabels from 'chartjs-plugin-datalabels';
 import { accountApi, formatCurrency } from '../services/api.js';
 import AddTransactionModal from './AddTransactionModal.js';
@@ -215,7 +217,11 @@ const AccountDetailContainer = styled.div`
       background-color: #f5f5f5;
     }
     
-    tr[style*="cursor: pointer"]:hover {
+    tr.clickable {
+      cursor: pointer;
+    }
+    
+    tr.clickable:hover {
       background-color: #e3f2fd;
       transform: scale(1.01);
       transition: all 0.2s;
@@ -316,6 +322,316 @@ const AccountDetailContainer = styled.div`
   }
 `;
 
+// 툴팁용 interaction mode: 마우스 x 픽셀에서 날짜(카테고리) 인덱스를 바로 구한다.
+// 'index' 모드처럼 같은 날짜의 점들을 모으지만, 마우스가 움직일 때마다 모든 점과의 거리를 계산하지 않는다.
+Interaction.modes.dateIndex = function (chart, e) {
+  const { x } = getRelativePosition(e, chart);
+  const index = chart.scales.x.getValueForPixel(x);
+  const items = [];
+  chart.getSortedVisibleDatasetMetas().forEach((meta) => {
+    const element = meta.data[index];
+    if (element && !element.skip) {
+      items.push({ element, datasetIndex: meta.index, index });
+    }
+  });
+  return items;
+};
+
+// 이보다 점이 많으면 차트 애니메이션을 끈다 (업데이트마다 모든 점을 보간하는 비용이 커진다)
+const CHART_ANIMATION_POINT_LIMIT = 200;
+
+// 거래 내역 테이블 행. Memoized so opening a modal or switching tabs doesn't re-render every row.
+const TransactionRow = React.memo(function TransactionRow({ transaction, showCategory, onSelect }) {
+  return (
+    <tr 
+      className={transaction.category === '이동' ? 'clickable transfer' : 'clickable'}
+      onClick={() => onSelect(transaction)}
+    >
+      <td className={transaction.type === 'income' ? 'income' : 'expense'}>
+        {transaction.type === 'income' ? '수입' : '지출'}
+      </td>
+      <td>{formatCurrency(transaction.amount)}</td>
+      {showCategory && <td>{transaction.category}</td>}
+      <td>{transaction.memo}</td>
+      <td>{transaction.date.substring(0, 10)}</td>
+    </tr>
+  );
+});
+
+const ValuationRow = React.memo(function ValuationRow({ valuation, onSelect }) {
+  const typeLabel = valuation.transaction_type === 'buy' ? '매수' : 
+                  valuation.transaction_type === 'sell' ? '매도' : '평가';
+  return (
+    <tr 
+      className="clickable valuation"
+      onClick={() => onSelect(valuation)}
+    >
+      <td className="valuation-type">{typeLabel}</td>
+      <td>{formatCurrency(valuation.evaluated_amount)}</td>
+      <td>{valuation.memo || '-'}</td>
+      <td>{valuation.evaluation_date.substring(0, 10)}</td>
+    </tr>
+  );
+});
+
+// 수익률 차트 데이터 (계좌와 평가 기록만 읽는 순수 함수)
+function calculateReturnRateData(account, valuations) {
+  if (!account || account.type !== '투자' || valuations.length === 0) {
+    return null;
+  }
+
+  // Parse each evaluation date once; every later comparison uses these epoch times
+  const timeById = new Map(valuations.map(v => [v.id, Date.parse(v.evaluation_date)]));
+
+  // Sort valuations by date
+  const sortedValuations = [...valuations].sort((a, b) => timeById.get(a.id) - timeById.get(b.id));
+
+  // Build pairs: 매수-매도 pair만 생성
+  const pairs = [];
+  const unpairedBuyValuations = []; // 페어링되지 않은 buy 기록들
+
+  sortedValuations.forEach((valuation) => {
+    if (valuation.transaction_type === 'buy') {
+      // buy 기록은 unpaired 목록에 추가
+      unpairedBuyValuations.push(valuation);
+    } else if (valuation.transaction_type === 'sell') {
+      // sell 기록이면 가장 오래된 unpaired buy와 페어링
+      if (unpairedBuyValuations.length > 0) {
+        const buyVal = unpairedBuyValuations.shift();
+        const sellAmount = valuation.evaluated_amount;
+        const buyAmount = buyVal.evaluated_amount;
+        const returnRate = ((sellAmount - buyAmount) / buyAmount) * 100;
+        
+        pairs.push({
+          buyDate: buyVal.evaluation_date,
+          buyTime: timeById.get(buyVal.id),
+          buyAmount: buyAmount,
+          sellDate: valuation.evaluation_date,
+          sellTime: timeById.get(valuation.id),
+          sellAmount: sellAmount,
+          returnRate: returnRate,
+          buyValuation: buyVal,
+          sellValuation: valuation
+        });
+      }
+    } else if (valuation.transaction_type === 'valuation') {
+      // valuation 기록이면 가장 오래된 unpaired buy와 페어링
+      if (unpairedBuyValuations.length > 0) {
+        // 이미 이 buy와 페어링된 pair가 있는지 확인
+        const buyVal = unpairedBuyValuations[0];
+        let existingPairIndex = -1;
+        for (let i = 0; i < pairs.length; i++) {
+          if (pairs[i].buyValuation?.id === buyVal.id && pairs[i].sellValuation?.transaction_type === 'valuation') {
+            existingPairIndex = i;
+            break;
+          }
+        }
+        
+        if (existingPairIndex >= 0) {
+          // 기존에 valuation과 페어링된 pair가 있으면 제거
+          pairs.splice(existingPairIndex, 1);
+        } else {
+          // 새로운 pair를 만들기 위해 unpaired에서 제거
+          unpairedBuyValuations.shift();
+        }
+        
+        // 새로운 valuation과 페어링
+        const sellAmount = valuation.evaluated_amount;
+        const buyAmount = buyVal.evaluated_amount;
+        const returnRate = ((sellAmount - buyAmount) / buyAmount) * 100;
+        
+        pairs.push({
+          buyDate: buyVal.evaluation_date,
+          buyTime: timeById.get(buyVal.id),
+          buyAmount: buyAmount,
+          sellDate: valuation.evaluation_date,
+          sellTime: timeById.get(valuation.id),
+          sellAmount: sellAmount,
+          returnRate: returnRate,
+          buyValuation: buyVal,
+          sellValuation: valuation
+        });
+      }
+    }
+  });
+
+  if (pairs.length === 0 && unpairedBuyValuations.length === 0) {
+    return null;
+  }
+
+  // 모든 날짜 수집 (매수 날짜, 매도 날짜, 페어링되지 않은 매수 날짜) - epoch ms
+  const allDatesSet = new Set();
+  pairs.forEach((pair) => {
+    allDatesSet.add(pair.buyTime);
+    allDatesSet.add(pair.sellTime);
+  });
+  unpairedBuyValuations.forEach((buyVal) => {
+    allDatesSet.add(timeById.get(buyVal.id));
+  });
+  const allDates = Array.from(allDatesSet).sort((a, b) => a - b);
+  const allLabels = allDates.map(time => 
+    new Date(time).toLocaleDateString('ko-KR', { month: 'short', day: 'numeric' })
+  );
+  // 날짜 -> x 인덱스: 데이터셋마다 전체 날짜를 비교하지 않고 두 칸만 채운다
+  const indexByTime = new Map(allDates.map((time, i) => [time, i]));
+
+  // 데이터셋별 툴팁 문구 (날짜 인덱스 -> 줄 목록): 차트를 만들 때 한 번만 포맷한다
+  const tooltipLines = [];
+
+  // 각 pair별로 데이터셋 생성
+  const datasets = pairs.map((pair, pairIndex) => {
+    const { buyTime, sellTime } = pair;
+    const buyIndex = indexByTime.get(buyTime);
+    const sellIndex = indexByTime.get(sellTime);
+    
+    // 각 날짜에 대한 데이터 포인트 생성 (해당 pair의 두 점에만 값, 나머지는 null)
+    const pairData = new Array(allDates.length).fill(null);
+    pairData[sellIndex] = pair.sellAmount;
+    pairData[buyIndex] = pair.buyAmount;
+
+    const lines = [];
+    // 매도 시점
+    lines[sellIndex] = [
+      `매도 금액: ${pair.sellAmount.toLocaleString()}원`,
+      `매수: ${pair.buyAmount.toLocaleString()}원`,
+      `매도: ${pair.sellAmount.toLocaleString()}원`,
+      `수익률: ${pair.returnRate.toFixed(1)}%`
+    ];
+    // 매수 시점
+    lines[buyIndex] = [
+      `매수 금액: ${pair.buyAmount.toLocaleString()}원`,
+      `매수일: ${new Date(buyTime).toLocaleDateString('ko-KR')}`
+    ];
+    tooltipLines.push(lines);
+
+    return {
+      label: pairIndex === 0 ? '금액 (원)' : '',
+      data: pairData,
+      borderColor: account.color || '#007bff',
+      backgroundColor: `${account.color || '#007bff'}20`,
+      fill: false,
+      tension: 0.4,
+      spanGaps: true,
+      pointRadius: (ctx) => {
+        const time = allDates[ctx.dataIndex];
+        if (time === buyTime || time === sellTime) {
+          return 6;
+        }
+        return 0;
+      },
+      pointHoverRadius: 8,
+      pointBackgroundColor: (ctx) => {
+        const time = allDates[ctx.dataIndex];
+        if (time === buyTime) {
+          return '#ffc107'; // 노란색 (매수)
+        } else if (time === sellTime) {
+          return account.color || '#007bff'; // 계좌 색상 (매도)
+        }
+        return 'transparent';
+      },
+      pointBorderColor: (ctx) => {
+        const time = allDates[ctx.dataIndex];
+        if (time === buyTime) {
+          return '#ffc107'; // 노란색 (매수)
+        } else if (time === sellTime) {
+          return account.color || '#007bff'; // 계좌 색상 (매도)
+        }
+        return 'transparent';
+      },
+    };
+  });
+
+  // 페어링되지 않은 매수 거래를 점으로 표시 - 매수마다 데이터셋을 만들지 않고 한 데이터셋에 모은다.
+  // 같은 날짜에 미매도 매수가 여럿이면 겹치지 않도록 층(데이터셋)을 하나씩 더 쓴다.
+  const unpairedLayers = [];
+  unpairedBuyValuations.forEach((buyVal) => {
+    const index = indexByTime.get(timeById.get(buyVal.id));
+    let layer = unpairedLayers.find(l => l.buys[index] === undefined);
+    if (!layer) {
+      layer = { data: new Array(allDates.length).fill(null), buys: [] };
+      unpairedLayers.push(layer);
+    }
+    layer.data[index] = buyVal.evaluated_amount;
+    layer.buys[index] = buyVal;
+  });
+
+  unpairedLayers.forEach((layer) => {
+    tooltipLines.push(layer.buys.map(buyVal => [
+      `매수 금액: ${buyVal.evaluated_amount.toLocaleString()}원`,
+      `매수일: ${new Date(timeById.get(buyVal.id)).toLocaleDateString('ko-KR')}`,
+      `(미매도)`
+    ]));
+    datasets.push({
+      label: '',
+      data: layer.data,
+      borderColor: '#ffc107',
+      backgroundColor: '#ffc107',
+      fill: false,
+      showLine: false, // 선을 표시하지 않고 점만 표시
+      pointRadius: (ctx) => {
+        if (layer.buys[ctx.dataIndex] !== undefined) {
+          return 6;
+        }
+        return 0;
+      },
+      pointHoverRadius: 8,
+      pointBackgroundColor: '#ffc107',
+      pointBorderColor: '#ffc107',
+    });
+  });
+
+  return {
+    labels: allLabels,
+    datasets: datasets,
+    pairs: pairs, // 차트에 pair 정보 저장
+    tooltipLines: tooltipLines, // 데이터셋별, 날짜 인덱스별 툴팁 문구 (tooltip에서 사용)
+    pointCount: pairs.length * 2 + unpairedBuyValuations.length
+  };
+}
+
+// 투자 계좌의 자산과 수익률 계산
+// 매수/매도 페어는 차트에서 이미 만든 것을 재사용하고, 최신 평가/최신 페어는 한 번의 순회로 찾는다
+function calculateInvestmentInfo(account, valuations, pairs) {
+  if (!account || account.type !== '투자' || valuations.length === 0) {
+    return { asset: account?.asset_value || 0, returnRate: account?.return_rate || 0 };
+  }
+
+  // 자산 계산: 최신 valuation 또는 account의 evaluated_amount 사용
+  let asset = 0;
+  let latestValuation = null;
+  let latestValuationTime = -Infinity;
+  valuations.forEach((valuation) => {
+    if (valuation.transaction_type !== 'valuation') {
+      return;
+    }
+    const time = Date.parse(valuation.evaluation_date);
+    if (latestValuation === null || time > latestValuationTime) {
+      latestValuation = valuation;
+      latestValuationTime = time;
+    }
+  });
+  
+  if (latestValuation) {
+    asset = latestValuation.evaluated_amount;
+  } else if (account.evaluated_amount > 0) {
+    asset = account.evaluated_amount;
+  }
+
+  // 수익률: 가장 최신 pair의 수익률 (매도일이 같으면 먼저 만들어진 pair)
+  let returnRate = 0;
+  let latestPair = null;
+  pairs.forEach((pair) => {
+    if (latestPair === null || pair.sellTime > latestPair.sellTime) {
+      latestPair = pair;
+    }
+  });
+  if (latestPair) {
+    returnRate = latestPair.returnRate;
+  }
+
+  return { asset, returnRate };
+}
+
 function AccountDetail() {
   const { id } = useParams();
   const [account, setAccount] = useState(null);
@@ -331,10 +647,20 @@ function AccountDetail() {
   const [isDeleteAccountDialogOpen, setIsDeleteAccountDialogOpen] = useState(false);
   const [isDeactivateAccountDialogOpen, setIsDeactivateAccountDialogOpen] = useState(false);
 
+  const refreshTimerRef = useRef(null);
+
   useEffect(() => {
     fetchAccountDetails();
   }, [id]);
 
+  useEffect(() => () => clearTimeout(refreshTimerRef.current), []);
+
+  // Coalesce refresh requests from modal callbacks into a single fetch
+  const scheduleRefresh = () => {
+    clearTimeout(refreshTimerRef.current);
+    refreshTimerRef.current = setTimeout(fetchAccountDetails, 0);
+  };
+
   const fetchAccountDetails = async () => {
     try {
       const [accountResponse, transactionsResponse] = await Promise.all([
@@ -369,49 +695,55 @@ function AccountDetail() {
       return account.asset_value || 0;
     }
 
-    // For other account types, calculate balance from transactions
-    const income = account.transactions
-      ? account.transactions
-        .filter(t => t.type === "income")
-        .reduce((sum, t) => sum + t.amount, 0)
-      : 0;
-
-    const expense = account.transactions
-      ? account.transactions
-        .filter(t => t.type === "expense")
-        .reduce((sum, t) => sum + t.amount, 0)
-      : 0;
-
-    return account.opening_balance + income - expense;
+    // For other account types, calculate balance from transactions in a single pass
+    return (account.transactions || []).reduce(
+      (sum, t) => (t.type === "income" ? sum + t.amount : sum - t.amount),
+      account.opening_balance
+    );
   };
 
+  // 투자 계좌 거래 내역 테이블 행: 거래 + 평가 기록을 최신순으로 합친 목록.
+  // Rebuilt only when the fetched data changes, not on every tab switch or modal toggle;
+  // each date is parsed once instead of twice per comparison.
+  const investmentHistory = useMemo(() => {
+    if (account?.type !== '투자') {
+      return [];
+    }
+    return [
+      ...transactions.map(t => ({ item: { ...t, itemType: 'transaction' }, time: Date.parse(t.date) })),
+      ...valuations.map(v => ({ item: { ...v, itemType: 'valuation' }, time: Date.parse(v.evaluation_date) }))
+    ]
+      .sort((a, b) => b.time - a.time) // 최신순
+      .map(entry => entry.item);
+  }, [account, transactions, valuations]);
+
   const handleAddTransaction = () => {
     setIsAddTransactionModalOpen(true);
   };
 
   const handleTransactionAdded = () => {
     // Refresh the transaction list
-    fetchAccountDetails();
+    scheduleRefresh();
   };
 
-  const handleTransactionClick = (transaction) => {
+  const handleTransactionClick = useCallback((transaction) => {
     setSelectedTransaction(transaction);
     setIsEditTransactionModalOpen(true);
-  };
+  }, []);
 
   const handleTransactionUpdated = () => {
-    fetchAccountDetails();
+    scheduleRefresh();
     setIsEditTransactionModalOpen(false);
     setSelectedTransaction(null);
   };
 
-  const handleValuationClick = (valuation) => {
+  const handleValuationClick = useCallback((valuation) => {
     setSelectedValuation(valuation);
     setIsEditValuationModalOpen(true);
-  };
+  }, []);
 
   const handleValuationUpdated = () => {
-    fetchAccountDetails();
+    scheduleRefresh();
     setIsEditValuationModalOpen(false);
     setSelectedValuation(null);
   };
@@ -422,7 +754,7 @@ function AccountDetail() {
 
   const handleAccountUpdated = () => {
     // Refresh the account details
-    fetchAccountDetails();
+    scheduleRefresh();
   };
 
   const handleDeleteAccount = () => {
@@ -473,296 +805,82 @@ function AccountDetail() {
     }
   };
 
-  const calculateReturnRateData = () => {
-    if (!account || account.type !== '투자' || valuations.length === 0) {
-      return null;
-    }
-
-    // Sort valuations by date
-    const sortedValuations = [...valuations].sort((a, b) => 
-      new Date(a.evaluation_date) - new Date(b.evaluation_date)
-    );
-
-    // Build pairs: 매수-매도 pair만 생성
-    const pairs = [];
-    const unpairedBuyValuations = []; // 페어링되지 않은 buy 기록들
-
-    sortedValuations.forEach((valuation) => {
-      if (valuation.transaction_type === 'buy') {
-        // buy 기록은 unpaired 목록에 추가
-        unpairedBuyValuations.push(valuation);
-      } else if (valuation.transaction_type === 'sell') {
-        // sell 기록이면 가장 오래된 unpaired buy와 페어링
-        if (unpairedBuyValuations.length > 0) {
-          const buyVal = unpairedBuyValuations.shift();
-          const sellAmount = valuation.evaluated_amount;
-          const buyAmount = buyVal.evaluated_amount;
-          const returnRate = ((sellAmount - buyAmount) / buyAmount) * 100;
-          
-          pairs.push({
-            buyDate: buyVal.evaluation_date,
-            buyAmount: buyAmount,
-            sellDate: valuation.evaluation_date,
-            sellAmount: sellAmount,
-            returnRate: returnRate,
-            buyValuation: buyVal,
-            sellValuation: valuation
-          });
-        }
-      } else if (valuation.transaction_type === 'valuation') {
-        // valuation 기록이면 가장 오래된 unpaired buy와 페어링
-        if (unpairedBuyValuations.length > 0) {
-          // 이미 이 buy와 페어링된 pair가 있는지 확인
-          const buyVal = unpairedBuyValuations[0];
-          let existingPairIndex = -1;
-          for (let i = 0; i < pairs.length; i++) {
-            if (pairs[i].buyValuation?.id === buyVal.id && pairs[i].sellValuation?.transaction_type === 'valuation') {
-              existingPairIndex = i;
-              break;
-            }
-          }
-          
-          if (existingPairIndex >= 0) {
-            // 기존에 valuation과 페어링된 pair가 있으면 제거
-            pairs.splice(existingPairIndex, 1);
-          } else {
-            // 새로운 pair를 만들기 위해 unpaired에서 제거
-            unpairedBuyValuations.shift();
-          }
-          
-          // 새로운 valuation과 페어링
-          const sellAmount = valuation.evaluated_amount;
-          const buyAmount = buyVal.evaluated_amount;
-          const returnRate = ((sellAmount - buyAmount) / buyAmount) * 100;
-          
-          pairs.push({
-            buyDate: buyVal.evaluation_date,
-            buyAmount: buyAmount,
-            sellDate: valuation.evaluation_date,
-            sellAmount: sellAmount,
-            returnRate: returnRate,
-            buyValuation: buyVal,
-            sellValuation: valuation
-          });
-        }
-      }
-    });
+  // 차트 데이터는 불러온 계좌/평가 기록이 바뀔 때만 다시 만든다 (탭 전환이나 모달 열기로는 다시 계산하지 않음)
+  const chartData = useMemo(() => calculateReturnRateData(account, valuations), [account, valuations]);
 
-    if (pairs.length === 0 && unpairedBuyValuations.length === 0) {
+  // 차트 옵션도 차트 데이터와 함께 고정한다: 다시 렌더링될 때마다 새 객체를 넘기면 chart.update가 매번 돈다
+  const returnRateChartOptions = useMemo(() => {
+    if (!chartData) {
       return null;
     }
-
-    // 모든 날짜 수집 (매수 날짜, 매도 날짜, 페어링되지 않은 매수 날짜)
-    const allDatesSet = new Set();
-    pairs.forEach((pair) => {
-      allDatesSet.add(new Date(pair.buyDate).getTime());
-      allDatesSet.add(new Date(pair.sellDate).getTime());
-    });
-    unpairedBuyValuations.forEach((buyVal) => {
-      allDatesSet.add(new Date(buyVal.evaluation_date).getTime());
-    });
-    const allDates = Array.from(allDatesSet).map(time => new Date(time)).sort((a, b) => a - b);
-    const allLabels = allDates.map(date => 
-      date.toLocaleDateString('ko-KR', { month: 'short', day: 'numeric' })
-    );
-
-    // 각 pair별로 데이터셋 생성
-    const datasets = pairs.map((pair, pairIndex) => {
-      const buyDate = new Date(pair.buyDate);
-      const sellDate = new Date(pair.sellDate);
-      
-      // 각 날짜에 대한 데이터 포인트 생성 (해당 pair의 두 점에만 값, 나머지는 null)
-      const pairData = allDates.map((date) => {
-        if (date.getTime() === buyDate.getTime()) {
-          return pair.buyAmount;
-        } else if (date.getTime() === sellDate.getTime()) {
-          return pair.sellAmount;
-        }
-        return null;
-      });
-
-      return {
-        label: pairIndex === 0 ? '금액 (원)' : '',
-        data: pairData,
-        borderColor: account.color || '#007bff',
-        backgroundColor: `${account.color || '#007bff'}20`,
-        fill: false,
-        tension: 0.4,
-        spanGaps: true,
-        pointRadius: (ctx) => {
-          const date = allDates[ctx.dataIndex];
-          if (date && (date.getTime() === buyDate.getTime() || date.getTime() === sellDate.getTime())) {
-            return 6;
-          }
-          return 0;
-        },
-        pointHoverRadius: 8,
-        pointBackgroundColor: (ctx) => {
-          const date = allDates[ctx.dataIndex];
-          if (date && date.getTime() === buyDate.getTime()) {
-            return '#ffc107'; // 노란색 (매수)
-          } else if (date && date.getTime() === sellDate.getTime()) {
-            return account.color || '#007bff'; // 계좌 색상 (매도)
-          }
-          return 'transparent';
+    return {
+      responsive: true,
+      maintainAspectRatio: true,
+      ...(chartData.pointCount > CHART_ANIMATION_POINT_LIMIT && { animation: false }),
+      plugins: {
+        legend: {
+          display: true,
+          position: 'top',
         },
-        pointBorderColor: (ctx) => {
-          const date = allDates[ctx.dataIndex];
-          if (date && date.getTime() === buyDate.getTime()) {
-            return '#ffc107'; // 노란색 (매수)
-          } else if (date && date.getTime() === sellDate.getTime()) {
-            return account.color || '#007bff'; // 계좌 색상 (매도)
+        datalabels: {
+          display: true,
+          color: '#333',
+          anchor: 'end',
+          align: 'top',
+          formatter: function(value) {
+            // 금액으로 표시
+            return (value / 10000).toFixed(0) + '만원';
+          },
+          font: {
+            size: 11,
+            weight: 'bold'
           }
-          return 'transparent';
         },
-      };
-    });
+        tooltip: {
+          mode: 'dateIndex',
+          intersect: false,
+          callbacks: {
+            label: function(context) {
+              // 매수/매도/미매도 매수 시점은 미리 만들어 둔 문구를 그대로 사용
+              const datasetLines = chartData.tooltipLines[context.datasetIndex];
+              const lines = datasetLines && datasetLines[context.dataIndex];
+              if (lines) {
+                return lines;
+              }
 
-    // 페어링되지 않은 매수 거래를 점으로 표시
-    unpairedBuyValuations.forEach((buyVal) => {
-      const buyDate = new Date(buyVal.evaluation_date);
-      const buyAmount = buyVal.evaluated_amount;
-      
-      const unpairedData = allDates.map((date) => {
-        if (date.getTime() === buyDate.getTime()) {
-          return buyAmount;
-        }
-        return null;
-      });
-
-      datasets.push({
-        label: '',
-        data: unpairedData,
-        borderColor: '#ffc107',
-        backgroundColor: '#ffc107',
-        fill: false,
-        showLine: false, // 선을 표시하지 않고 점만 표시
-        pointRadius: (ctx) => {
-          const date = allDates[ctx.dataIndex];
-          if (date && date.getTime() === buyDate.getTime()) {
-            return 6;
+              return `금액: ${context.parsed.y.toLocaleString()}원`;
+            }
           }
-          return 0;
-        },
-        pointHoverRadius: 8,
-        pointBackgroundColor: '#ffc107',
-        pointBorderColor: '#ffc107',
-      });
-    });
-
-    return {
-      labels: allLabels,
-      datasets: datasets,
-      pairs: pairs, // 차트에 pair 정보 저장 (tooltip에서 사용)
-      unpairedBuyValuations: unpairedBuyValuations, // 페어링되지 않은 매수 정보 저장 (tooltip에서 사용)
-      allDates: allDates // 날짜 배열 저장 (tooltip에서 사용)
-    };
-  };
-
-  const chartData = calculateReturnRateData();
-
-  // 투자 계좌의 자산과 수익률 계산
-  const calculateInvestmentInfo = () => {
-    if (!account || account.type !== '투자' || valuations.length === 0) {
-      return { asset: account?.asset_value || 0, returnRate: account?.return_rate || 0 };
-    }
-
-    // Sort valuations by date
-    const sortedValuations = [...valuations].sort((a, b) => 
-      new Date(a.evaluation_date) - new Date(b.evaluation_date)
-    );
-
-    // Build pairs와 unpaired buys (차트 로직과 동일)
-    const pairs = [];
-    const unpairedBuys = [];
-    const unpairedBuyValuations = [];
-
-    sortedValuations.forEach((valuation) => {
-      if (valuation.transaction_type === 'buy') {
-        unpairedBuys.push({
-          buyDate: valuation.evaluation_date,
-          buyAmount: valuation.evaluated_amount,
-          buyValuation: valuation
-        });
-        unpairedBuyValuations.push(valuation);
-      } else if (valuation.transaction_type === 'sell') {
-        if (unpairedBuys.length > 0) {
-          const buy = unpairedBuys.shift();
-          const buyVal = unpairedBuyValuations.shift();
-          const sellAmount = valuation.evaluated_amount;
-          const returnRate = ((sellAmount - buy.buyAmount) / buy.buyAmount) * 100;
-          
-          pairs.push({
-            buyDate: buy.buyDate,
-            buyAmount: buy.buyAmount,
-            sellDate: valuation.evaluation_date,
-            sellAmount: sellAmount,
-            returnRate: returnRate,
-            buyValuations: [buyVal],
-            sellValuation: valuation
-          });
         }
-      } else if (valuation.transaction_type === 'valuation') {
-        if (unpairedBuys.length > 0) {
-          const buy = unpairedBuys[0];
-          const buyVal = unpairedBuyValuations[0];
-          
-          let existingPairIndex = -1;
-          for (let i = 0; i < pairs.length; i++) {
-            if (pairs[i].buyValuations[0]?.id === buyVal.id) {
-              existingPairIndex = i;
-              break;
+      },
+      scales: {
+        y: {
+          beginAtZero: false,
+          ticks: {
+            callback: function(value) {
+              // 금액으로 표시 (만원 단위)
+              return (value / 10000).toFixed(0) + '만원';
             }
+          },
+          title: {
+            display: true,
+            text: '금액 (원)'
           }
-          
-          if (existingPairIndex >= 0) {
-            pairs.splice(existingPairIndex, 1);
-          } else {
-            unpairedBuys.shift();
-            unpairedBuyValuations.shift();
+        },
+        x: {
+          title: {
+            display: true,
+            text: '날짜'
           }
-          
-          const sellAmount = valuation.evaluated_amount;
-          const returnRate = ((sellAmount - buy.buyAmount) / buy.buyAmount) * 100;
-          
-          pairs.push({
-            buyDate: buy.buyDate,
-            buyAmount: buy.buyAmount,
-            sellDate: valuation.evaluation_date,
-            sellAmount: sellAmount,
-            returnRate: returnRate,
-            buyValuations: [buyVal],
-            sellValuation: valuation
-          });
         }
       }
-    });
-
-    // 자산 계산: 최신 valuation 또는 account의 evaluated_amount 사용
-    let asset = 0;
-    const latestValuation = sortedValuations
-      .filter(v => v.transaction_type === 'valuation')
-      .sort((a, b) => new Date(b.evaluation_date) - new Date(a.evaluation_date))[0];
-    
-    if (latestValuation) {
-      asset = latestValuation.evaluated_amount;
-    } else if (account.evaluated_amount > 0) {
-      asset = account.evaluated_amount;
-    }
-
-    // 수익률: 가장 최신 pair의 수익률
-    let returnRate = 0;
-    if (pairs.length > 0) {
-      const latestPair = pairs.sort((a, b) => 
-        new Date(b.sellDate) - new Date(a.sellDate)
-      )[0];
-      returnRate = latestPair.returnRate;
-    }
-
-    return { asset, returnRate };
-  };
+    };
+  }, [chartData]);
 
-  const investmentInfo = account?.type === '투자' ? calculateInvestmentInfo() : null;
+  const investmentInfo = useMemo(
+    () => (account?.type === '투자' ? calculateInvestmentInfo(account, valuations, chartData?.pairs || []) : null),
+    [account, valuations, chartData]
+  );
 
   if (!account) {
     return <div>Loading...</div>;
@@ -849,52 +967,13 @@ function AccountDetail() {
                       </tr>
                     </thead>
                     <tbody>
-                      {[
-                        // Combine transactions and valuations, sorted by date
-                        ...transactions.map(t => ({ ...t, itemType: 'transaction' })),
-                        ...valuations.map(v => ({ ...v, itemType: 'valuation' }))
-                      ]
-                        .sort((a, b) => {
-                          const dateA = a.itemType === 'transaction' ? a.date : a.evaluation_date;
-                          const dateB = b.itemType === 'transaction' ? b.date : b.evaluation_date;
-                          return new Date(dateB) - new Date(dateA); // 최신순
-                        })
-                        .map(item => {
-                          if (item.itemType === 'transaction') {
-                            return (
-                              <tr 
-                                key={item.id} 
-                                className={item.category === '이동' ? 'transfer' : ''}
-                                onClick={() => handleTransactionClick(item)}
-                                style={{ cursor: 'pointer' }}
-                              >
-                                <td className={item.type === 'income' ? 'income' : 'expense'}>
-                                  {item.type === 'income' ? '수입' : '지출'}
-                                </td>
-                                <td>{formatCurrency(item.amount)}</td>
-                                <td>{item.memo}</td>
-                                <td>{item.date.substring(0, 10)}</td>
-                              </tr>
-                            );
-                          } else {
-                            // Valuation record
-                            const typeLabel = item.transaction_type === 'buy' ? '매수' : 
-                                            item.transaction_type === 'sell' ? '매도' : '평가';
-                            return (
-                              <tr 
-                                key={item.id} 
-                                className="valuation"
-                                onClick={() => handleValuationClick(item)}
-                                style={{ cursor: 'pointer' }}
-                              >
-                                <td className="valuation-type">{typeLabel}</td>
-                                <td>{formatCurrency(item.evaluated_amount)}</td>
-                                <td>{item.memo || '-'}</td>
-                                <td>{item.evaluation_date.substring(0, 10)}</td>
-                              </tr>
-                            );
-                          }
-                        })}
+                      {investmentHistory.map(item => (
+                        item.itemType === 'transaction' ? (
+                          <TransactionRow key={item.id} transaction={item} onSelect={handleTransactionClick} />
+                        ) : (
+                          <ValuationRow key={item.id} valuation={item} onSelect={handleValuationClick} />
+                        )
+                      ))}
                     </tbody>
                   </table>
                 ) : (
@@ -907,106 +986,7 @@ function AccountDetail() {
                 {chartData && valuations.length > 0 ? (
                   <Line
                     data={chartData}
-                    options={{
-                      responsive: true,
-                      maintainAspectRatio: true,
-                      plugins: {
-                        legend: {
-                          display: true,
-                          position: 'top',
-                        },
-                        datalabels: {
-                          display: true,
-                          color: '#333',
-                          anchor: 'end',
-                          align: 'top',
-                          formatter: function(value) {
-                            // 금액으로 표시
-                            return (value / 10000).toFixed(0) + '만원';
-                          },
-                          font: {
-                            size: 11,
-                            weight: 'bold'
-                          }
-                        },
-                        tooltip: {
-                          mode: 'index',
-                          intersect: false,
-                          callbacks: {
-                            label: function(context) {
-                              const pairs = chartData.pairs || [];
-                              const unpairedBuyValuations = chartData.unpairedBuyValuations || [];
-                              const allDates = chartData.allDates || [];
-                              const datasetIndex = context.datasetIndex;
-                              const dataIndex = context.dataIndex;
-                              
-                              // Pair 데이터셋 처리
-                              if (datasetIndex < pairs.length && dataIndex < allDates.length) {
-                                const pair = pairs[datasetIndex];
-                                const date = allDates[dataIndex];
-                                const buyDate = new Date(pair.buyDate);
-                                const sellDate = new Date(pair.sellDate);
-                                
-                                if (date.getTime() === buyDate.getTime()) {
-                                  // 매수 시점
-                                  return [
-                                    `매수 금액: ${context.parsed.y.toLocaleString()}원`,
-                                    `매수일: ${buyDate.toLocaleDateString('ko-KR')}`
-                                  ];
-                                } else if (date.getTime() === sellDate.getTime()) {
-                                  // 매도 시점
-                                  return [
-                                    `매도 금액: ${context.parsed.y.toLocaleString()}원`,
-                                    `매수: ${pair.buyAmount.toLocaleString()}원`,
-                                    `매도: ${pair.sellAmount.toLocaleString()}원`,
-                                    `수익률: ${pair.returnRate.toFixed(1)}%`
-                                  ];
-                                }
-                              }
-                              
-                              // 페어링되지 않은 매수 데이터셋 처리
-                              const unpairedStartIndex = pairs.length;
-                              if (datasetIndex >= unpairedStartIndex && datasetIndex < unpairedStartIndex + unpairedBuyValuations.length && dataIndex < allDates.length) {
-                                const buyVal = unpairedBuyValuations[datasetIndex - unpairedStartIndex];
-                                const date = allDates[dataIndex];
-                                const buyDate = new Date(buyVal.evaluation_date);
-                                
-                                if (date.getTime() === buyDate.getTime()) {
-                                  return [
-                                    `매수 금액: ${context.parsed.y.toLocaleString()}원`,
-                                    `매수일: ${buyDate.toLocaleDateString('ko-KR')}`,
-                                    `(미매도)`
-                                  ];
-                                }
-                              }
-                              
-                              return `금액: ${context.parsed.y.toLocaleString()}원`;
-                            }
-                          }
-                        }
-                      },
-                      scales: {
-                        y: {
-                          beginAtZero: false,
-                          ticks: {
-                            callback: function(value) {
-                              // 금액으로 표시 (만원 단위)
-                              return (value / 10000).toFixed(0) + '만원';
-                            }
-                          },
-                          title: {
-                            display: true,
-                            text: '금액 (원)'
-                          }
-                        },
-                        x: {
-                          title: {
-                            display: true,
-                            text: '날짜'
-                          }
-                        }
-                      }
-                    }}
+                    options={returnRateChartOptions}
                   />
                 ) : (
                   <p>수익률 데이터가 없습니다. 평가 기록을 추가해주세요.</p>
@@ -1034,20 +1014,12 @@ function AccountDetail() {
               </thead>
               <tbody>
                 {transactions.map(transaction => (
-                  <tr 
-                    key={transaction.id} 
-                    className={transaction.category === '이동' ? 'transfer' : ''}
-                    onClick={() => handleTransactionClick(transaction)}
-                    style={{ cursor: 'pointer' }}
-                  >
-                    <td className={transaction.type === 'income' ? 'income' : 'expense'}>
-                      {transaction.type === 'income' ? '수입' : '지출'}
-                    </td>
-                    <td>{formatCurrency(transaction.amount)}</td>
-                    <td>{transaction.category}</td>
-                    <td>{transaction.memo}</td>
-                    <td>{transaction.date.substring(0, 10)}</td>
-                  </tr>
+                  <TransactionRow
+                    key={transaction.id}
+                    transaction={transaction}
+                    showCategory
+                    onSelect={handleTransactionClick}
+                  />
                 ))}
               </tbody>
             </table>
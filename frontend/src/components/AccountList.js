@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import styled from 'styled-components';
 import { useNavigate } from 'react-router-dom';
 import { accountApi, statsApi, formatCurrency, getTextColor } from '../services/api';
@@ -26,8 +26,9 @@ const AccountGrid = styled.div`
   }
 `;
 
+// Colors come in through CSS variables so every card shares one generated class
 const AccountCard = styled.div`
-  background-color: ${props => props.color || '#f8f9fa'};
+  background-color: var(--account-color, #f8f9fa);
   border-radius: 16px;
   height: 100px;
   box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
@@ -67,13 +68,13 @@ const AccountCard = styled.div`
     font-size: 14px;
     font-weight: 400;
     margin-bottom: 4px;
-    color: ${props => props.textColor || '#333'};
+    color: var(--account-text-color, #333);
   }
   
   .account-balance {
     font-size: 22px;
     font-weight: 800;
-    color: ${props => props.textColor || '#333'};
+    color: var(--account-text-color, #333);
   }
 `;
 
@@ -113,6 +114,126 @@ const TotalAssets = styled.div`
   }
 `;
 
+const ACCOUNT_TYPE_ORDER = { "현금": 0, "투자": 1, "소비": 2 };
+
+// Investment category display order
+const INVESTMENT_CATEGORY_ORDER = { "주식": 0, "연금": 1, "코인": 2, "기타": 3 };
+
+// Categorize investment accounts
+function categorizeInvestmentAccount(account) {
+  const name = account.name;
+  if (name.includes("연금")) return "연금";
+  if (name.includes("코인")) return "코인";
+  if (name.includes("주식") || name.includes("증권") || name.includes("나무") || 
+      name.includes("한국투자") || name.includes("IBK") || name.includes("OK저축은행")) {
+    return "주식";
+  }
+  return "기타";
+}
+
+function calculateInvestmentAsset(account) {
+  // valuations가 없거나 빈 배열이면 기존 값 사용
+  if (!account.valuations || account.valuations.length === 0) {
+    // asset_value가 있으면 사용, 없으면 evaluated_amount 사용
+    return account.asset_value || account.evaluated_amount || 0;
+  }
+
+  // Parse each evaluation date once; the sorts below compare numbers only
+  const times = new Map(account.valuations.map(v => [v, Date.parse(v.evaluation_date)]));
+
+  // Sort valuations by date
+  const sortedValuations = [...account.valuations].sort((a, b) => times.get(a) - times.get(b));
+
+  // 매수-매도 pair 생성 (차트 로직과 동일)
+  const pairs = [];
+  const unpairedBuyValuations = [];
+
+  sortedValuations.forEach((valuation) => {
+    if (valuation.transaction_type === 'buy') {
+      unpairedBuyValuations.push(valuation);
+    } else if (valuation.transaction_type === 'sell') {
+      // sell 기록이면 가장 오래된 unpaired buy와 페어링
+      if (unpairedBuyValuations.length > 0) {
+        unpairedBuyValuations.shift();
+        // pair는 거래 완료로 간주하고 무시
+      }
+    } else if (valuation.transaction_type === 'valuation') {
+      // valuation 기록이면 가장 오래된 unpaired buy와 페어링
+      if (unpairedBuyValuations.length > 0) {
+        // 이미 이 buy와 페어링된 pair가 있는지 확인
+        const buyVal = unpairedBuyValuations[0];
+        let existingPairIndex = -1;
+        for (let i = 0; i < pairs.length; i++) {
+          if (pairs[i].buyValuation?.id === buyVal.id && pairs[i].sellValuation?.transaction_type === 'valuation') {
+            existingPairIndex = i;
+            break;
+          }
+        }
+        
+        if (existingPairIndex >= 0) {
+          pairs.splice(existingPairIndex, 1);
+        } else {
+          unpairedBuyValuations.shift();
+        }
+      }
+    }
+  });
+
+  // 페어링되지 않은 매수 중 가장 최신 것을 찾기
+  if (unpairedBuyValuations.length > 0) {
+    // 날짜순으로 정렬하여 가장 최신 것 찾기
+    const latestUnpairedBuy = unpairedBuyValuations.sort((a, b) => times.get(b) - times.get(a))[0];
+    return latestUnpairedBuy.evaluated_amount;
+  }
+
+  // 페어링되지 않은 매수가 없으면 최신 매도 금액 반환
+  const sellOrValuationValuations = sortedValuations.filter(v => 
+    v.transaction_type === 'sell' || v.transaction_type === 'valuation'
+  );
+  
+  if (sellOrValuationValuations.length > 0) {
+    // 날짜순으로 정렬하여 가장 최신 것 찾기
+    const latestSellOrValuation = sellOrValuationValuations.sort((a, b) => times.get(b) - times.get(a))[0];
+    return latestSellOrValuation.evaluated_amount;
+  }
+
+  // 매도나 valuation도 없으면 0 반환
+  return 0;
+}
+
+function calculateBalance(account) {
+  if (account.type === '투자') {
+    // 투자 계좌는 자산 계산 로직 사용
+    return calculateInvestmentAsset(account);
+  }
+
+  // For other account types, calculate balance from transactions in a single pass
+  return (account.transactions || []).reduce(
+    (sum, t) => (t.type === "income" ? sum + t.amount : sum - t.amount),
+    account.opening_balance
+  );
+}
+
+const AccountCardItem = React.memo(function AccountCardItem({ account, color, onSelect }) {
+  const textColor = getTextColor(color);
+  return (
+    <AccountCard
+      style={{ '--account-color': color, '--account-text-color': textColor }}
+      onClick={() => onSelect(account.id)}
+    >
+      <div className="account-icon">
+        {account.name.charAt(0)}
+      </div>
+      <div className="account-info">
+        <div className="account-name">{account.name}</div>
+        <div className="account-balance">
+          {formatCurrency(calculateBalance(account))}
+        </div>
+      </div>
+    </AccountCard>
+  );
+});
+
 function AccountList() {
   const navigate = useNavigate();
   const [accounts, setAccounts] = useState([]);
@@ -124,12 +245,24 @@ function AccountList() {
     fetchTotalAssets();
   }, []);
 
+  // Reload the list when an account is added from the header
+  useEffect(() => {
+    const handleAccountsChanged = () => {
+      fetchAccounts();
+      fetchTotalAssets();
+    };
+    window.addEventListener('accountsChanged', handleAccountsChanged);
+    return () => window.removeEventListener('accountsChanged', handleAccountsChanged);
+  }, []);
+
+  // Stable handler so memoized cards skip re-rendering when only totals change
+  const handleSelectAccount = useCallback((accountId) => {
+    navigate(`/account/${accountId}`);
+  }, [navigate]);
+
   const fetchAccounts = async () => {
     try {
-      console.log('Fetching accounts...'); // Debug log
       const response = await accountApi.getAllAccounts();
-      console.log('Accounts API response:', response); // Debug log
-      console.log('Accounts data:', response.data); // Debug log
 
       if (!response.data || !Array.isArray(response.data)) {
         console.error('Invalid accounts data received:', response.data);
@@ -158,24 +291,18 @@ function AccountList() {
         })
       );
 
-      // Sort accounts to match the desktop app behavior
-      const sortedAccounts = accountsWithValuations.sort((a, b) => {
-        // First by status (active first)
-        if (a.status === "dead" && b.status !== "dead") return 1;
-        if (a.status !== "dead" && b.status === "dead") return -1;
-
-        // Then by type order
-        const typeOrder = { "현금": 0, "투자": 1, "소비": 2 };
-        const aTypeOrder = typeOrder[a.type] !== undefined ? typeOrder[a.type] : 3;
-        const bTypeOrder = typeOrder[b.type] !== undefined ? typeOrder[b.type] : 3;
-        if (aTypeOrder !== bTypeOrder) return aTypeOrder - bTypeOrder;
-
-        // Finally by name (민규 first)
-        const aHasMinGyu = a.name.includes("민규") ? 0 : 1;
-        const bHasMinGyu = b.name.includes("민규") ? 0 : 1;
-        return aHasMinGyu - bHasMinGyu;
-      });
-      console.log('Sorted accounts:', sortedAccounts); // Debug log
+      // Sort accounts to match the desktop app behavior:
+      // status (active first), then type order, then name (민규 first).
+      // Keys are computed once per account instead of once per comparison.
+      const sortedAccounts = accountsWithValuations
+        .map(account => ({
+          account,
+          dead: account.status === "dead" ? 1 : 0,
+          typeOrder: ACCOUNT_TYPE_ORDER[account.type] !== undefined ? ACCOUNT_TYPE_ORDER[account.type] : 3,
+          minGyu: account.name.includes("민규") ? 0 : 1
+        }))
+        .sort((a, b) => (a.dead - b.dead) || (a.typeOrder - b.typeOrder) || (a.minGyu - b.minGyu))
+        .map(item => item.account);
       setAccounts(sortedAccounts);
     } catch (error) {
       console.error('Error fetching accounts:', error);
@@ -196,166 +323,43 @@ function AccountList() {
     }
   };
 
-  const formatCurrency = (amount) => {
-    if (amount === undefined || amount === null) return '₩0';
-    return `₩${amount.toLocaleString()}`;
-  };
-
-  const calculateInvestmentAsset = (account) => {
-    console.log(`Calculating asset for ${account.name}:`, {
-      valuations: account.valuations?.length || 0,
-      asset_value: account.asset_value,
-      evaluated_amount: account.evaluated_amount
-    });
-    
-    // valuations가 없거나 빈 배열이면 기존 값 사용
-    if (!account.valuations || account.valuations.length === 0) {
-      // asset_value가 있으면 사용, 없으면 evaluated_amount 사용
-      const fallbackValue = account.asset_value || account.evaluated_amount || 0;
-      console.log(`No valuations, using fallback: ${fallbackValue}`);
-      return fallbackValue;
-    }
-
-    // Sort valuations by date
-    const sortedValuations = [...account.valuations].sort((a, b) => 
-      new Date(a.evaluation_date) - new Date(b.evaluation_date)
-    );
-
-    // 매수-매도 pair 생성 (차트 로직과 동일)
-    const pairs = [];
-    const unpairedBuyValuations = [];
-
-    sortedValuations.forEach((valuation) => {
-      if (valuation.transaction_type === 'buy') {
-        unpairedBuyValuations.push(valuation);
-      } else if (valuation.transaction_type === 'sell') {
-        // sell 기록이면 가장 오래된 unpaired buy와 페어링
-        if (unpairedBuyValuations.length > 0) {
-          unpairedBuyValuations.shift();
-          // pair는 거래 완료로 간주하고 무시
-        }
-      } else if (valuation.transaction_type === 'valuation') {
-        // valuation 기록이면 가장 오래된 unpaired buy와 페어링
-        if (unpairedBuyValuations.length > 0) {
-          // 이미 이 buy와 페어링된 pair가 있는지 확인
-          const buyVal = unpairedBuyValuations[0];
-          let existingPairIndex = -1;
-          for (let i = 0; i < pairs.length; i++) {
-            if (pairs[i].buyValuation?.id === buyVal.id && pairs[i].sellValuation?.transaction_type === 'valuation') {
-              existingPairIndex = i;
-              break;
-            }
-          }
-          
-          if (existingPairIndex >= 0) {
-            pairs.splice(existingPairIndex, 1);
-          } else {
-            unpairedBuyValuations.shift();
-          }
-        }
+  // Grid layout depends only on the fetched accounts; don't regroup/resort when
+  // unrelated state (e.g. the totals) changes
+  const { groupedActiveAccounts, deadAccounts } = useMemo(() => {
+    // Separate active and dead accounts
+    const activeAccounts = accounts.filter(account => account.status !== "dead");
+    const deadAccounts = accounts.filter(account => account.status === "dead");
+
+    // Group active accounts by type
+    const groupedActiveAccounts = activeAccounts.reduce((groups, account) => {
+      const type = account.type;
+      if (!groups[type]) {
+        groups[type] = [];
       }
-    });
-
-    // 페어링되지 않은 매수 중 가장 최신 것을 찾기
-    if (unpairedBuyValuations.length > 0) {
-      // 날짜순으로 정렬하여 가장 최신 것 찾기
-      const latestUnpairedBuy = unpairedBuyValuations.sort((a, b) => 
-        new Date(b.evaluation_date) - new Date(a.evaluation_date)
-      )[0];
-      
-      const result = latestUnpairedBuy.evaluated_amount;
-      console.log(`Using latest unpaired buy: ${result}`);
-      return result;
-    }
-
-    // 페어링되지 않은 매수가 없으면 최신 매도 금액 반환
-    const sellOrValuationValuations = sortedValuations.filter(v => 
-      v.transaction_type === 'sell' || v.transaction_type === 'valuation'
-    );
-    
-    if (sellOrValuationValuations.length > 0) {
-      // 날짜순으로 정렬하여 가장 최신 것 찾기
-      const latestSellOrValuation = sellOrValuationValuations.sort((a, b) => 
-        new Date(b.evaluation_date) - new Date(a.evaluation_date)
-      )[0];
-      
-      const result = latestSellOrValuation.evaluated_amount;
-      console.log(`No unpaired buys, using latest sell/valuation: ${result}`);
-      return result;
-    }
-
-    // 매도나 valuation도 없으면 0 반환
-    console.log(`No unpaired buys and no sell/valuation, returning 0`);
-    return 0;
-  };
-
-  const calculateBalance = (account) => {
-    if (account.type === '투자') {
-      // 투자 계좌는 자산 계산 로직 사용
-      return calculateInvestmentAsset(account);
-    }
-
-    // For other account types, calculate balance from transactions
-    const income = account.transactions
-      ? account.transactions
-        .filter(t => t.type === "income")
-        .reduce((sum, t) => sum + t.amount, 0)
-      : 0;
-
-    const expense = account.transactions
-      ? account.transactions
-        .filter(t => t.type === "expense")
-        .reduce((sum, t) => sum + t.amount, 0)
-      : 0;
-
-    return account.opening_balance + income - expense;
-  };
-
-  // Separate active and dead accounts
-  const activeAccounts = accounts.filter(account => account.status !== "dead");
-  const deadAccounts = accounts.filter(account => account.status === "dead");
-  
-  // Categorize investment accounts
-  const categorizeInvestmentAccount = (account) => {
-    const name = account.name;
-    if (name.includes("연금")) return "연금";
-    if (name.includes("코인")) return "코인";
-    if (name.includes("주식") || name.includes("증권") || name.includes("나무") || 
-        name.includes("한국투자") || name.includes("IBK") || name.includes("OK저축은행")) {
-      return "주식";
+      groups[type].push(account);
+      return groups;
+    }, {});
+
+    // Sort investment accounts by category
+    if (groupedActiveAccounts["투자"]) {
+      groupedActiveAccounts["투자"].sort((a, b) => {
+        const categoryA = categorizeInvestmentAccount(a);
+        const categoryB = categorizeInvestmentAccount(b);
+        
+        const orderA = INVESTMENT_CATEGORY_ORDER[categoryA] !== undefined ? INVESTMENT_CATEGORY_ORDER[categoryA] : 4;
+        const orderB = INVESTMENT_CATEGORY_ORDER[categoryB] !== undefined ? INVESTMENT_CATEGORY_ORDER[categoryB] : 4;
+        
+        if (orderA !== orderB) {
+          return orderA - orderB;
+        }
+        
+        // If same category, sort by name
+        return a.name.localeCompare(b.name);
+      });
     }
-    return "기타";
-  };
 
-  // Group active accounts by type
-  const groupedActiveAccounts = activeAccounts.reduce((groups, account) => {
-    const type = account.type;
-    if (!groups[type]) {
-      groups[type] = [];
-    }
-    groups[type].push(account);
-    return groups;
-  }, {});
-
-  // Sort investment accounts by category
-  if (groupedActiveAccounts["투자"]) {
-    groupedActiveAccounts["투자"].sort((a, b) => {
-      const categoryA = categorizeInvestmentAccount(a);
-      const categoryB = categorizeInvestmentAccount(b);
-      
-      // Define category order
-      const categoryOrder = { "주식": 0, "연금": 1, "코인": 2, "기타": 3 };
-      const orderA = categoryOrder[categoryA] !== undefined ? categoryOrder[categoryA] : 4;
-      const orderB = categoryOrder[categoryB] !== undefined ? categoryOrder[categoryB] : 4;
-      
-      if (orderA !== orderB) {
-        return orderA - orderB;
-      }
-      
-      // If same category, sort by name
-      return a.name.localeCompare(b.name);
-    });
-  }
+    return { groupedActiveAccounts, deadAccounts };
+  }, [accounts]);
 
   return (
     <div>
@@ -369,29 +373,14 @@ function AccountList() {
         <AccountSection key={type}>
           <AccountTypeHeader>{type} 계좌</AccountTypeHeader>
           <AccountGrid>
-            {accountsOfType.map(account => {
-              const bgColor = account.color;
-              const textColor = getTextColor(bgColor);
-              console.log(`Account ${account.name}: bgColor=${bgColor}, textColor=${textColor}`); // Debug log
-              return (
-                <AccountCard
-                  key={account.id}
-                  color={bgColor}
-                  textColor={textColor}
-                  onClick={() => navigate(`/account/${account.id}`)}
-                >
-                  <div className="account-icon">
-                    {account.name.charAt(0)}
-                  </div>
-                  <div className="account-info">
-                    <div className="account-name">{account.name}</div>
-                    <div className="account-balance">
-                      {formatCurrency(calculateBalance(account))}
-                    </div>
-                  </div>
-                </AccountCard>
-              );
-            })}
+            {accountsOfType.map(account => (
+              <AccountCardItem
+                key={account.id}
+                account={account}
+                color={account.color}
+                onSelect={handleSelectAccount}
+              />
+            ))}
           </AccountGrid>
         </AccountSection>
       ))}
@@ -400,28 +389,14 @@ function AccountList() {
         <AccountSection>
           <AccountTypeHeader>비활성화된 계좌</AccountTypeHeader>
           <AccountGrid>
-            {deadAccounts.map(account => {
-              const bgColor = "#808080";
-              const textColor = getTextColor(bgColor);
-              return (
-                <AccountCard
-                  key={account.id}
-                  color={bgColor}
-                  textColor={textColor}
-                  onClick={() => navigate(`/account/${account.id}`)}
-                >
-                  <div className="account-icon">
-                    {account.name.charAt(0)}
-                  </div>
-                  <div className="account-info">
-                    <div className="account-name">{account.name}</div>
-                    <div className="account-balance">
-                      {formatCurrency(calculateBalance(account))}
-                    </div>
-                  </div>
-                </AccountCard>
-              );
-            })}
+            {deadAccounts.map(account => (
+              <AccountCardItem
+                key={account.id}
+                account={account}
+                color="#808080"
+                onSelect={handleSelectAccount}
+              />
+            ))}
           </AccountGrid>
         </AccountSection>
       )}
@@ -87,6 +87,25 @@ const Button = styled.button`
   }
 `;
 
+// Year (2020-2040) and month (1-12) options never change, so build them once
+const YEAR_OPTIONS = [];
+for (let year = 2020; year <= 2040; year++) {
+  YEAR_OPTIONS.push(
+    <option key={year} value={year}>
+      {year}년
+    </option>
+  );
+}
+
+const MONTH_OPTIONS = [];
+for (let month = 1; month <= 12; month++) {
+  MONTH_OPTIONS.push(
+    <option key={month} value={month}>
+      {month}월
+    </option>
+  );
+}
+
 function AddSalaryModal({ isOpen, onClose, onSalaryAdded }) {
   const currentYear = new Date().getFullYear();
   const [formData, setFormData] = useState({
@@ -126,26 +145,6 @@ function AddSalaryModal({ isOpen, onClose, onSalaryAdded }) {
 
   if (!isOpen) return null;
 
-  // Generate year options (2020-2040)
-  const yearOptions = [];
-  for (let year = 2020; year <= 2040; year++) {
-    yearOptions.push(
-      <option key={year} value={year}>
-        {year}년
-      </option>
-    );
-  }
-
-  // Generate month options (1-12)
-  const monthOptions = [];
-  for (let month = 1; month <= 12; month++) {
-    monthOptions.push(
-      <option key={month} value={month}>
-        {month}월
-      </option>
-    );
-  }
-
   return (
     <ModalOverlay onClick={onClose}>
       <ModalContent onClick={e => e.stopPropagation()}>
@@ -159,7 +158,7 @@ function AddSalaryModal({ isOpen, onClose, onSalaryAdded }) {
               value={formData.year}
               onChange={handleChange}
             >
-              {yearOptions}
+              {YEAR_OPTIONS}
             </select>
           </FormGroup>
           
@@ -171,7 +170,7 @@ function AddSalaryModal({ isOpen, onClose, onSalaryAdded }) {
               value={formData.month}
               onChange={handleChange}
             >
-              {monthOptions}
+              {MONTH_OPTIONS}
             </select>
           </FormGroup>
           
@@ -92,6 +92,13 @@ const Button = styled.button`
   }
 `;
 
+// 거래 타입별 카테고리 목록 (렌더링마다 배열을 새로 만들지 않도록 모듈 상수로 유지)
+const CATEGORY_OPTIONS = {
+  income: ['저축', '이자', '이동', '대출'],
+  expense: ['지출', '투자', '이동']
+};
+const NO_CATEGORY_OPTIONS = [];
+
 function AddTransactionModal({ isOpen, onClose, accountId, onTransactionAdded, accountType }) {
   const isInvestment = accountType === '투자';
   const [formData, setFormData] = useState({
@@ -133,12 +140,9 @@ function AddTransactionModal({ isOpen, onClose, accountId, onTransactionAdded, a
 
   const getCategoryOptions = () => {
     if (isInvestment) {
-      return []; // 투자 계좌는 카테고리 없음
-    } else {
-      return formData.type === 'income' 
-        ? ['저축', '이자', '이동', '대출'] 
-        : ['지출', '투자', '이동'];
+      return NO_CATEGORY_OPTIONS; // 투자 계좌는 카테고리 없음
     }
+    return formData.type === 'income' ? CATEGORY_OPTIONS.income : CATEGORY_OPTIONS.expense;
   };
 
   const handleSubmit = async (e) => {
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import styled from 'styled-components';
 import { accountApi } from '../services/api';
 
@@ -103,27 +103,14 @@ function EditAccountModal({ isOpen, onClose, account, onAccountUpdated }) {
     evaluated_amount: 0
   });
 
-  const calculateBalance = (account) => {
-    if (account.type === '투자') {
-      // For investment accounts, use asset_value if available
-      return account.asset_value || 0;
-    }
-    
-    // For other account types, calculate balance from transactions
-    const income = account.transactions
-      ? account.transactions
-          .filter(t => t.type === "income")
-          .reduce((sum, t) => sum + t.amount, 0)
-      : 0;
-      
-    const expense = account.transactions
-      ? account.transactions
-          .filter(t => t.type === "expense")
-          .reduce((sum, t) => sum + t.amount, 0)
-      : 0;
-      
-    return account.opening_balance + income - expense;
-  };
+  // Income minus expense over the account's transactions; computed once per account
+  // and shared by the initial balance and the opening_balance back-calculation on save
+  const transactionNet = useMemo(() => (
+    (account?.transactions || []).reduce(
+      (sum, t) => (t.type === "income" ? sum + t.amount : sum - t.amount),
+      0
+    )
+  ), [account]);
 
   useEffect(() => {
     if (account) {
@@ -131,13 +118,13 @@ function EditAccountModal({ isOpen, onClose, account, onAccountUpdated }) {
         name: account.name,
         type: account.type,
         color: account.color,
-        balance: account.type === '투자' ? account.asset_value : calculateBalance(account),
+        balance: account.type === '투자' ? account.asset_value : account.opening_balance + transactionNet,
         image_path: account.image_path || '',
         purchase_amount: account.purchase_amount || 0,
         evaluated_amount: account.evaluated_amount || 0
       });
     }
-  }, [account]);
+  }, [account, transactionNet]);
 
   const handleChange = (e) => {
     const { name, value } = e.target;
@@ -169,18 +156,8 @@ function EditAccountModal({ isOpen, onClose, account, onAccountUpdated }) {
       } else {
         // For regular accounts, calculate opening_balance from current balance
         // We need to reverse-calculate: balance = opening_balance + income - expense
-        const income = account.transactions
-          ? account.transactions
-              .filter(t => t.type === "income")
-              .reduce((sum, t) => sum + t.amount, 0)
-          : 0;
-        const expense = account.transactions
-          ? account.transactions
-              .filter(t => t.type === "expense")
-              .reduce((sum, t) => sum + t.amount, 0)
-          : 0;
         // If balance changed, adjust opening_balance
-        const currentBalance = account.opening_balance + income - expense;
+        const currentBalance = account.opening_balance + transactionNet;
         const balanceDiff = formData.balance - currentBalance;
         updateData.opening_balance = account.opening_balance + balanceDiff;
       }
@@ -101,6 +101,16 @@ const Button = styled.button`
   }
 `;
 
+// 거래 타입별 카테고리 목록 (렌더링마다 배열을 새로 만들지 않도록 모듈 상수로 유지)
+const CATEGORY_OPTIONS = {
+  income: ['저축', '이자', '이동', '대출'],
+  expense: ['지출', '투자', '이동']
+};
+const INVESTMENT_CATEGORY_OPTIONS = {
+  income: ['이동', '수익'],
+  expense: ['이동', '손익']
+};
+
 function EditTransactionModal({ isOpen, onClose, transaction, accountId, onTransactionUpdated, accountType }) {
   const [formData, setFormData] = useState({
     type: 'income',
@@ -146,15 +156,8 @@ function EditTransactionModal({ isOpen, onClose, transaction, accountId, onTrans
   };
 
   const getCategoryOptions = () => {
-    if (accountType === '투자') {
-      return formData.type === 'income' 
-        ? ['이동', '수익'] 
-        : ['이동', '손익'];
-    } else {
-      return formData.type === 'income' 
-        ? ['저축', '이자', '이동', '대출'] 
-        : ['지출', '투자', '이동'];
-    }
+    const options = accountType === '투자' ? INVESTMENT_CATEGORY_OPTIONS : CATEGORY_OPTIONS;
+    return formData.type === 'income' ? options.income : options.expense;
   };
 
   const handleSubmit = async (e) => {
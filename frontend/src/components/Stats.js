@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, useMemo } from 'react';
 import styled from 'styled-components';
 import { statsApi, formatCurrency } from '../services/api';
 import { Chart as ChartJS, ArcElement, Tooltip, Legend } from 'chart.js';
@@ -130,6 +130,62 @@ const StatCard = styled.div`
   }
 `;
 
+// 자산 카테고리별 차트 색상 (렌더링마다 새로 만들지 않도록 모듈 수준에 둔다)
+const CATEGORY_COLORS = {
+  "현금": "#4CAF50",
+  "부동산": "#2196F3",
+  "코인": "#FF9800",
+  "연금": "#FF5722", // Distinct color for pension
+  "주식": "#9C27B0",
+  "기타": "#607D8B"
+};
+
+const getColorForCategory = (category) => CATEGORY_COLORS[category] || "#9E9E9E";
+
+// Chart.js plugin that leaves a gap between the doughnut and its legend
+const legendMargin = {
+  id: 'legendMargin',
+  beforeInit(chart) {
+    if (chart.legend) {
+      const originalFit = chart.legend.fit;
+      chart.legend.fit = function fit() {
+        if (originalFit) {
+          originalFit.bind(chart.legend)();
+        }
+        this.width += 100; // Increase width reserve
+      };
+    }
+  },
+  afterUpdate(chart) {
+    // Shift the legend text to the right to create visual gap
+    if (chart.legend) {
+      chart.legend.left += 80;
+    }
+  }
+};
+
+const PORTFOLIO_PLUGINS = [legendMargin];
+
+// 연도 선택 옵션 (올해 기준 -5년 ~ +4년); 세 탭이 같은 목록을 공유한다
+const currentYear = new Date().getFullYear();
+const YEAR_OPTIONS = Array.from({ length: 10 }, (_, i) => (currentYear - 5 + i).toString()).map(year => (
+  <option key={year} value={year}>{year}년</option>
+));
+
+// 캐시에 없는 연도를 요청하기 전에 기다리는 시간
+const YEAR_CHANGE_DEBOUNCE_MS = 250;
+
+const calculatePercentage = (value, total) => {
+  return total > 0 ? ((value / total) * 100).toFixed(1) : 0;
+};
+
+// 월급 조회 키: 분류가 없는 기록은 '월급'으로 본다
+const salaryKey = (month, person, classification) => `${month}|${person}|${classification || '월급'}`;
+
+// 월급 막대 툴팁: 합계 (보너스/월급)
+const formatSalaryTooltip = ({ total, bonus, salary }) =>
+  `${formatCurrency(total)} (${formatCurrency(bonus)}/${formatCurrency(salary)})`;
+
 function Stats() {
   const [activeTab, setActiveTab] = useState('portfolio');
   const [selectedYear, setSelectedYear] = useState(new Date().getFullYear().toString());
@@ -144,97 +200,239 @@ function Stats() {
   const [editingSalary, setEditingSalary] = useState(null);
   const [showEditModal, setShowEditModal] = useState(false);
 
-  // Debugging: Log hoveredBar state changes
-  useEffect(() => {
-    console.log('hoveredBar state changed:', hoveredBar);
-  }, [hoveredBar]);
-
-  useEffect(() => {
-    fetchStats();
-  }, []);
-
   const [monthlyIncome, setMonthlyIncome] = useState({});
 
-  const fetchStats = async () => {
+  // 연도별 통계 응답 캐시: 이미 본 연도로 돌아갈 때 다시 요청하지 않는다
+  const yearStatsCache = useRef(new Map());
+  // 가장 최근에 선택한 연도: 늦게 도착한 이전 연도 응답이 화면을 덮어쓰지 않게 한다
+  const requestedYear = useRef(selectedYear);
+  // 첫 로드는 디바운스 없이 바로 요청하고, 이후 사용자가 연도를 바꿀 때만 디바운스한다
+  const initialStatsLoaded = useRef(false);
+
+  const applyYearStats = (stats) => {
+    setMonthlyIncome(stats.monthlyIncome);
+    setSalaries(stats.salaries);
+    setMinGuiMedianSalary(stats.minGuiMedianSalary);
+    setHaYoungMedianSalary(stats.haYoungMedianSalary);
+    setMonthlySalaryTotals(stats.monthlySalaryTotals);
+  };
+
+  // 연도와 무관한 자산 통계는 마운트 시 한 번만 가져온다
+  const fetchOverview = async () => {
     try {
-      const [allocationResponse, assetsResponse, cashResponse, incomeResponse, salaryResponse, minGuiMedianResponse, haYoungMedianResponse, monthlyTotalsResponse] = await Promise.all([
+      const [allocationResponse, assetsResponse, cashResponse] = await Promise.all([
         statsApi.getAssetAllocation(),
         statsApi.getTotalAssets(),
-        statsApi.getTotalCash(),
-        statsApi.getMonthlyIncomeBreakdown(selectedYear),
-        statsApi.getSalaries(selectedYear),
-        statsApi.getSalaryMedian(selectedYear, '민규'), // Fetch MinGui median
-        statsApi.getSalaryMedian(selectedYear, '하영'), // Fetch HaYoung median
-        statsApi.getMonthlySalaryTotals(selectedYear) // Fetch monthly totals
+        statsApi.getTotalCash()
       ]);
 
       setAssetAllocation(allocationResponse.data);
       setTotalAssets(assetsResponse.data.total_assets);
       setTotalCash(cashResponse.data.total_cash);
-      setMonthlyIncome(incomeResponse.data);
-      setSalaries(salaryResponse.data);
-      setMinGuiMedianSalary(minGuiMedianResponse.data.median_salary || 0); // Set MinGui median
-      setHaYoungMedianSalary(haYoungMedianResponse.data.median_salary || 0); // Set HaYoung median
-      setMonthlySalaryTotals(monthlyTotalsResponse.data.monthly_totals || {}); // Set monthly totals
+    } catch (error) {
+      console.error('Error fetching stats:', error);
+    }
+  };
+
+  const fetchStats = async (year = selectedYear) => {
+    const cached = yearStatsCache.current.get(year);
+    if (cached) {
+      applyYearStats(cached);
+      return;
+    }
+
+    try {
+      const [incomeResponse, salaryResponse, minGuiMedianResponse, haYoungMedianResponse, monthlyTotalsResponse] = await Promise.all([
+        statsApi.getMonthlyIncomeBreakdown(year),
+        statsApi.getSalaries(year),
+        statsApi.getSalaryMedian(year, '민규'), // Fetch MinGui median
+        statsApi.getSalaryMedian(year, '하영'), // Fetch HaYoung median
+        statsApi.getMonthlySalaryTotals(year) // Fetch monthly totals
+      ]);
 
-      // In a full implementation, we would also set the other data
+      const stats = {
+        monthlyIncome: incomeResponse.data,
+        salaries: salaryResponse.data,
+        minGuiMedianSalary: minGuiMedianResponse.data.median_salary || 0,
+        haYoungMedianSalary: haYoungMedianResponse.data.median_salary || 0,
+        monthlySalaryTotals: monthlyTotalsResponse.data.monthly_totals || {}
+      };
+      yearStatsCache.current.set(year, stats);
+      if (year === requestedYear.current) {
+        applyYearStats(stats);
+      }
     } catch (error) {
       console.error('Error fetching stats:', error);
     }
   };
 
+  // 월급 수정/삭제 후에는 캐시를 비우고 현재 연도를 다시 가져온다
+  const refreshStats = () => {
+    yearStatsCache.current.clear();
+    fetchStats(requestedYear.current);
+  };
+
   useEffect(() => {
-    fetchStats();
+    fetchOverview();
+  }, []);
+
+  // 헤더에서 월급/계좌를 추가하면 해당 통계만 다시 가져온다
+  useEffect(() => {
+    const handleSalariesChanged = () => refreshStats();
+    const handleAccountsChanged = () => fetchOverview();
+    window.addEventListener('salariesChanged', handleSalariesChanged);
+    window.addEventListener('accountsChanged', handleAccountsChanged);
+    return () => {
+      window.removeEventListener('salariesChanged', handleSalariesChanged);
+      window.removeEventListener('accountsChanged', handleAccountsChanged);
+    };
+  }, []);
+
+  useEffect(() => {
+    requestedYear.current = selectedYear;
+    if (!initialStatsLoaded.current || yearStatsCache.current.has(selectedYear)) {
+      initialStatsLoaded.current = true;
+      fetchStats(selectedYear);
+      return;
+    }
+    // 키보드로 연도를 빠르게 넘길 때는 멈춘 연도만 요청해 막대 애니메이션이 겹치지 않게 한다
+    const timer = setTimeout(() => fetchStats(selectedYear), YEAR_CHANGE_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
   }, [selectedYear]);
 
 
-  const renderPortfolioTab = () => {
-    const legendMargin = {
-      id: 'legendMargin',
-      beforeInit(chart) {
-        if (chart.legend) {
-          const originalFit = chart.legend.fit;
-          chart.legend.fit = function fit() {
-            if (originalFit) {
-              originalFit.bind(chart.legend)();
-            }
-            this.width += 100; // Increase width reserve
-          };
-        }
-      },
-      afterUpdate(chart) {
-        // Shift the legend text to the right to create visual gap
-        if (chart.legend) {
-          chart.legend.left += 80;
-        }
+  // 순수익/저축 탭이 공유하는 연간 합계를 한 번의 순회로 계산
+  const incomeTotals = useMemo(() => {
+    let totalSavings = 0;
+    let totalInterest = 0;
+    let totalExpense = 0;
+
+    Object.values(monthlyIncome).forEach(monthData => {
+      totalSavings += (monthData.savings || 0);
+      totalInterest += (monthData.interest || 0);
+      totalExpense += (monthData.expense || 0);
+    });
+
+    return { totalSavings, totalInterest, totalExpense };
+  }, [monthlyIncome]);
+
+  // 월급 목록을 한 번만 순회하며 월별 그룹, 합계, 지급 횟수, 최댓값을 함께 계산
+  const salarySummary = useMemo(() => {
+    // Group salaries by month, person, and classification (salary vs bonus)
+    const monthlySalaries = {};
+    const totals = { 민규: 0, 하영: 0 };
+    const paymentCounts = { 민규: 0, 하영: 0 };
+    const salaryLookup = new Map();
+    let totalSalary = 0;
+    let maxSalary = 1;
+
+    salaries.forEach(salary => {
+      const month = salary.month;
+      const person = salary.person;
+      const amount = salary.amount;
+      const classification = salary.classification || '월급'; // Default to '월급' if not specified
+
+      if (!monthlySalaries[month]) {
+        monthlySalaries[month] = {
+          민규: { salary: 0, bonus: 0, total: 0 },
+          하영: { salary: 0, bonus: 0, total: 0 },
+          total: 0
+        };
       }
-    };
 
-    const getColorForCategory = (category) => {
-      const colors = {
-        "현금": "#4CAF50",
-        "부동산": "#2196F3",
-        "코인": "#FF9800",
-        "연금": "#FF5722", // Distinct color for pension
-        "주식": "#9C27B0",
-        "기타": "#607D8B"
-      };
-      return colors[category] || "#9E9E9E";
-    };
+      const personData = monthlySalaries[month][person];
+      if (classification === '보너스') {
+        personData.bonus += amount;
+      } else {
+        personData.salary += amount;
+      }
+      personData.total += amount;
+      monthlySalaries[month].total += amount;
+
+      totalSalary += amount;
+      totals[person] += amount;
+      paymentCounts[person] += 1;
+
+      // 월/사람/분류별 첫 기록: 막대를 클릭할 때 목록을 다시 훑지 않고 바로 찾는다
+      const key = salaryKey(month, person, classification);
+      if (!salaryLookup.has(key)) {
+        salaryLookup.set(key, salary);
+      }
+    });
+
+    // Find the maximum salary value for chart scaling; bar tooltips are formatted here once
+    Object.values(monthlySalaries).forEach(data => {
+      maxSalary = Math.max(maxSalary, data.민규.total, data.하영.total);
+      data.민규.tooltip = formatSalaryTooltip(data.민규);
+      data.하영.tooltip = formatSalaryTooltip(data.하영);
+    });
 
-    const calculatePercentage = (value, total) => {
-      return total > 0 ? ((value / total) * 100).toFixed(1) : 0;
+    return {
+      monthlySalaries,
+      totalSalary,
+      minGuiTotal: totals.민규,
+      haYoungTotal: totals.하영,
+      minGuiPaymentCount: paymentCounts.민규,
+      haYoungPaymentCount: paymentCounts.하영,
+      maxSalary,
+      salaryLookup
     };
+  }, [salaries]);
+
+  // 월급 막대를 클릭하면 수정 모달을 연다. classifications 순서대로 해당 월/사람의 기록을 찾는다.
+  const openSalaryEditor = async (month, person, classifications) => {
+    const selectedSalary = classifications
+      .map(classification => salarySummary.salaryLookup.get(salaryKey(month, person, classification)))
+      .find(Boolean);
+
+    if (!selectedSalary) {
+      // If we still can't find the data, show an error
+      console.error('Could not find salary data for', month, person, classifications.join('/'));
+      return;
+    }
+
+    // Now we need to find the index of this salary in the full array
+    // Fetch all salaries to get the full array
+    try {
+      const allSalariesResponse = await statsApi.getSalaries();
+      const fullArrayIndex = allSalariesResponse.data.findIndex(s =>
+        s.month === selectedSalary.month &&
+        s.person === selectedSalary.person &&
+        s.amount === selectedSalary.amount &&
+        s.classification === selectedSalary.classification
+      );
+
+      if (fullArrayIndex !== -1) {
+        setEditingSalary({ ...selectedSalary, index: fullArrayIndex });
+        setShowEditModal(true);
+      } else {
+        // If we still can't find the data, show an error
+        console.error('Could not find salary data in full array for', month, person, classifications.join('/'));
+      }
+    } catch (error) {
+      console.error('Error fetching all salaries:', error);
+    }
+  };
 
+  // 포트폴리오 도넛 차트 데이터/옵션은 자산 배분이 바뀔 때만 새로 만든다.
+  // 연도 변경이나 hover 등으로 다시 렌더링될 때 같은 객체를 넘겨 차트 업데이트를 건너뛴다.
+  const portfolioChart = useMemo(() => {
     const total = Object.values(assetAllocation).reduce((sum, value) => sum + value, 0);
 
+    const labels = Object.keys(assetAllocation);
+    const values = Object.values(assetAllocation);
+    const colors = labels.map(getColorForCategory);
+    // 툴팁/데이터 라벨 문자열은 hover마다 만들지 않고 여기서 한 번만 만든다
+    const percentages = values.map(value => calculatePercentage(value, total));
+    const tooltipLabels = labels.map((label, i) => `${label}: ${formatCurrency(values[i])} (${percentages[i]}%)`);
+
     const chartData = {
-      labels: Object.keys(assetAllocation),
+      labels,
       datasets: [
         {
-          data: Object.values(assetAllocation),
-          backgroundColor: Object.keys(assetAllocation).map(category => getColorForCategory(category)),
-          borderColor: Object.keys(assetAllocation).map(category => getColorForCategory(category)),
+          data: values,
+          backgroundColor: colors,
+          borderColor: colors,
           borderWidth: 1,
         },
       ],
@@ -252,7 +450,6 @@ function Stats() {
             },
             generateLabels: (chart) => {
               const data = chart.data;
-              const total = Object.values(assetAllocation).reduce((sum, value) => sum + value, 0);
               if (data.labels.length && data.datasets.length) {
                 return data.labels.map((label, i) => {
                   const style = data.datasets[0].backgroundColor[i];
@@ -274,18 +471,13 @@ function Stats() {
         },
         tooltip: {
           callbacks: {
-            label: function (context) {
-              const label = context.label || '';
-              const value = context.parsed;
-              const percentage = calculatePercentage(value, total);
-              return `${label}: ${formatCurrency(value)} (${percentage}%)`;
-            }
+            label: (context) => tooltipLabels[context.dataIndex]
           }
         },
         datalabels: {
           color: '#fff',
           formatter: (value, context) => {
-            const percentage = calculatePercentage(value, total);
+            const percentage = percentages[context.dataIndex];
             return percentage > 0 ? `${percentage}%` : '';
           },
           font: {
@@ -301,6 +493,12 @@ function Stats() {
       },
     };
 
+    return { total, chartData, chartOptions };
+  }, [assetAllocation]);
+
+  const renderPortfolioTab = () => {
+    const { total, chartData, chartOptions } = portfolioChart;
+
     return (
       <div className="tab-content">
         <div className="summary">
@@ -322,7 +520,7 @@ function Stats() {
         <div className="chart-container">
           {Object.keys(assetAllocation).length > 0 ? (
             <div style={{ width: '100%', maxWidth: '500px', height: '500px', display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
-              <Doughnut data={chartData} options={chartOptions} plugins={[legendMargin]} />
+              <Doughnut data={chartData} options={chartOptions} plugins={PORTFOLIO_PLUGINS} />
             </div>
           ) : (
             <div className="chart-placeholder">
@@ -336,15 +534,8 @@ function Stats() {
   };
 
   const renderNetIncomeTab = () => {
-    // Calculate summary statistics
-    let totalIncome = 0;
-    let totalExpense = 0;
-
-    Object.values(monthlyIncome).forEach(monthData => {
-      totalIncome += (monthData.savings || 0) + (monthData.interest || 0);
-      totalExpense += (monthData.expense || 0);
-    });
-
+    const { totalSavings, totalInterest, totalExpense } = incomeTotals;
+    const totalIncome = totalSavings + totalInterest;
     const netIncome = totalIncome - totalExpense;
 
     return (
@@ -359,9 +550,7 @@ function Stats() {
                   onChange={(e) => setSelectedYear(e.target.value)}
                   style={{ padding: '8px 12px', borderRadius: '4px', border: '1px solid #ddd', fontSize: '1rem' }}
                 >
-                  {years.map(year => (
-                    <option key={year} value={year}>{year}년</option>
-                  ))}
+                  {YEAR_OPTIONS}
                 </select>
               </div>
             )}
@@ -404,15 +593,7 @@ function Stats() {
   };
 
   const renderSavingsTab = () => {
-    // Calculate summary statistics
-    let totalSavings = 0;
-    let totalInterest = 0;
-
-    Object.values(monthlyIncome).forEach(monthData => {
-      totalSavings += (monthData.savings || 0);
-      totalInterest += (monthData.interest || 0);
-    });
-
+    const { totalSavings, totalInterest } = incomeTotals;
     const total = totalSavings + totalInterest;
 
     return (
@@ -427,9 +608,7 @@ function Stats() {
                   onChange={(e) => setSelectedYear(e.target.value)}
                   style={{ padding: '8px 12px', borderRadius: '4px', border: '1px solid #ddd', fontSize: '1rem' }}
                 >
-                  {years.map(year => (
-                    <option key={year} value={year}>{year}년</option>
-                  ))}
+                  {YEAR_OPTIONS}
                 </select>
               </div>
             )}
@@ -467,51 +646,24 @@ function Stats() {
   };
 
   const renderSalaryTab = () => {
-    // Group salaries by month, person, and classification (salary vs bonus)
-    const monthlySalaries = {};
-    salaries.forEach(salary => {
-      const month = salary.month;
-      const person = salary.person;
-      const amount = salary.amount;
-      const classification = salary.classification || '월급'; // Default to '월급' if not specified
-
-      if (!monthlySalaries[month]) {
-        monthlySalaries[month] = {
-          민규: { salary: 0, bonus: 0, total: 0 },
-          하영: { salary: 0, bonus: 0, total: 0 },
-          total: 0
-        };
-      }
-
-      if (classification === '보너스') {
-        monthlySalaries[month][person].bonus += amount;
-      } else {
-        monthlySalaries[month][person].salary += amount;
-      }
-      monthlySalaries[month][person].total += amount;
-      monthlySalaries[month].total += amount;
-    });
+    const {
+      monthlySalaries,
+      totalSalary,
+      minGuiTotal,
+      haYoungTotal,
+      minGuiPaymentCount,
+      haYoungPaymentCount,
+      maxSalary
+    } = salarySummary;
 
     // Sort months chronologically
     const sortedMonths = Object.keys(monthlySalaries).sort();
 
-    // Calculate summary statistics
-    const totalSalary = Object.values(monthlySalaries).reduce((sum, monthData) => sum + monthData.total, 0);
-    const minGuiTotal = Object.values(monthlySalaries).reduce((sum, monthData) => sum + monthData.민규.total, 0);
-    const haYoungTotal = Object.values(monthlySalaries).reduce((sum, monthData) => sum + monthData.하영.total, 0);
-
-    // Calculate payment counts for each person
-    const minGuiPaymentCount = salaries.filter(salary => salary.person === '민규').length;
-    const haYoungPaymentCount = salaries.filter(salary => salary.person === '하영').length;
-
     // Calculate averages
     const averageSalary = salaries.length > 0 ? Math.round(totalSalary / salaries.length) : 0;
     const minGuiAverage = minGuiPaymentCount > 0 ? Math.round(minGuiTotal / minGuiPaymentCount) : 0;
     const haYoungAverage = haYoungPaymentCount > 0 ? Math.round(haYoungTotal / haYoungPaymentCount) : 0;
 
-    // Find the maximum salary value for chart scaling
-    const maxSalary = Math.max(...Object.values(monthlySalaries).map(data => Math.max(data.민규.total, data.하영.total)), 1);
-
     // Calculate y-axis grid values based on the new formula
     // Round up maxSalary to nearest 100,000 and divide by 5
     const roundedMaxSalary = Math.ceil(maxSalary / 100000) * 100000;
@@ -537,9 +689,7 @@ function Stats() {
                   onChange={(e) => setSelectedYear(e.target.value)}
                   style={{ padding: '8px 12px', borderRadius: '4px', border: '1px solid #ddd', fontSize: '1rem' }}
                 >
-                  {years.map(year => (
-                    <option key={year} value={year}>{year}년</option>
-                  ))}
+                  {YEAR_OPTIONS}
                 </select>
               </div>
             )}
@@ -585,9 +735,6 @@ function Stats() {
                   {/* Bars */}
                   <div
                     style={{ flex: 1, display: 'flex', alignItems: 'flex-end', gap: '2%', paddingBottom: '20px', borderBottom: '1px solid #ddd', position: 'relative', paddingLeft: '0.5%', paddingRight: '0.5%' }}
-                    onMouseMove={(e) => {
-                      console.log('Mouse moved in chart area - coordinates:', e.clientX, e.clientY);
-                    }}
                   >
                     {/* Y-axis grid lines */}
                     <div style={{ position: 'absolute', top: '0px', left: 0, right: 0, bottom: '20px', display: 'flex', flexDirection: 'column', justifyContent: 'space-between', paddingTop: '0px', paddingBottom: '0px' }}>
@@ -628,7 +775,7 @@ function Stats() {
                                 pointerEvents: 'none'
                               }}
                             >
-                              {formatCurrency(data.민규.total)} ({formatCurrency(data.민규.bonus)}/{formatCurrency(data.민규.salary)})
+                              {data.민규.tooltip}
                             </div>
                             {/* MinGui stacked bar: salary (opaque) + bonus (transparent) */}
                             <div
@@ -641,138 +788,20 @@ function Stats() {
                                 transition: 'height 0.3s ease',
                                 cursor: 'pointer'
                               }}
-                              onMouseEnter={() => {
-                                console.log('Mouse entered minGui bar for month:', month);
-                                setHoveredBar(`${month}-minGui`);
-                              }}
-                              onMouseLeave={() => {
-                                console.log('Mouse left minGui bar for month:', month);
-                                setHoveredBar(null);
-                              }}
-                              onMouseMove={(e) => {
-                                console.log('Mouse moved over minGui bar for month:', month, '- coordinates:', e.clientX, e.clientY);
-                              }}
-                              onClick={async (e) => {
+                              onMouseEnter={() => setHoveredBar(`${month}-minGui`)}
+                              onMouseLeave={() => setHoveredBar(null)}
+                              onClick={(e) => {
                                 // Determine which segment was clicked based on position
                                 const rect = e.currentTarget.getBoundingClientRect();
                                 const clickY = e.clientY - rect.top;
                                 const isBonusClicked = clickY < minGuiBonusHeight;
-
-                                // Find the appropriate salary data based on which segment was clicked
-                                // We need to find the correct index in the original salaries array
-                                let salaryIndex = -1;
-                                for (let i = 0; i < salaries.length; i++) {
-                                  const s = salaries[i];
-                                  if (s.month === month && s.person === '민규') {
-                                    if (isBonusClicked && s.classification === '보너스') {
-                                      salaryIndex = i;
-                                      break;
-                                    } else if (!isBonusClicked && (s.classification === undefined || s.classification === '월급')) {
-                                      salaryIndex = i;
-                                      break;
-                                    }
-                                  }
-                                }
-
-                                if (salaryIndex !== -1) {
-                                  // Get the actual salary data from the filtered array
-                                  const selectedSalary = salaries[salaryIndex];
-
-                                  // Now we need to find the index of this salary in the full array
-                                  // Fetch all salaries to get the full array
-                                  try {
-                                    const allSalariesResponse = await statsApi.getSalaries();
-                                    const allSalaries = allSalariesResponse.data;
-
-                                    // Find the index in the full array that matches our selected salary
-                                    let fullArrayIndex = -1;
-                                    for (let i = 0; i < allSalaries.length; i++) {
-                                      const s = allSalaries[i];
-                                      if (s.month === selectedSalary.month &&
-                                        s.person === selectedSalary.person &&
-                                        s.amount === selectedSalary.amount &&
-                                        s.classification === selectedSalary.classification) {
-                                        fullArrayIndex = i;
-                                        break;
-                                      }
-                                    }
-
-                                    if (fullArrayIndex !== -1) {
-                                      console.log('Clicked on salary data at index:', fullArrayIndex, 'in full array for month:', month, 'person: 민규', 'classification:', isBonusClicked ? '보너스' : '월급');
-                                      setEditingSalary({ ...selectedSalary, index: fullArrayIndex });
-                                      setShowEditModal(true);
-                                    } else {
-                                      // If we still can't find the data, show an error
-                                      console.error('Could not find salary data in full array for', month, '민규', isBonusClicked ? '보너스' : '월급');
-                                    }
-                                  } catch (error) {
-                                    console.error('Error fetching all salaries:', error);
-                                  }
-                                } else {
-                                  // If we still can't find the data, show an error
-                                  console.error('Could not find salary data for', month, '민규', isBonusClicked ? '보너스' : '월급');
-                                }
+                                openSalaryEditor(month, '민규', [isBonusClicked ? '보너스' : '월급']);
                               }}
-                              onContextMenu={async (e) => {
+                              onContextMenu={(e) => {
                                 // For mobile long-press, we'll use context menu as a workaround
                                 e.preventDefault();
                                 // Try to find a bonus entry first, then fall back to regular salary
-                                let salaryIndex = -1;
-                                // Try to find a bonus entry first
-                                for (let i = 0; i < salaries.length; i++) {
-                                  const s = salaries[i];
-                                  if (s.month === month && s.person === '민규' && s.classification === '보너스') {
-                                    salaryIndex = i;
-                                    break;
-                                  }
-                                }
-                                if (salaryIndex === -1) {
-                                  // Fall back to regular salary
-                                  for (let i = 0; i < salaries.length; i++) {
-                                    const s = salaries[i];
-                                    if (s.month === month && s.person === '민규' && (s.classification === undefined || s.classification === '월급')) {
-                                      salaryIndex = i;
-                                      break;
-                                    }
-                                  }
-                                }
-                                if (salaryIndex !== -1) {
-                                  // Get the actual salary data from the filtered array
-                                  const selectedSalary = salaries[salaryIndex];
-
-                                  // Now we need to find the index of this salary in the full array
-                                  // Fetch all salaries to get the full array
-                                  try {
-                                    const allSalariesResponse = await statsApi.getSalaries();
-                                    const allSalaries = allSalariesResponse.data;
-
-                                    // Find the index in the full array that matches our selected salary
-                                    let fullArrayIndex = -1;
-                                    for (let i = 0; i < allSalaries.length; i++) {
-                                      const s = allSalaries[i];
-                                      if (s.month === selectedSalary.month &&
-                                        s.person === selectedSalary.person &&
-                                        s.amount === selectedSalary.amount &&
-                                        s.classification === selectedSalary.classification) {
-                                        fullArrayIndex = i;
-                                        break;
-                                      }
-                                    }
-
-                                    if (fullArrayIndex !== -1) {
-                                      console.log('Clicked on salary data at index:', fullArrayIndex, 'in full array for month:', month, 'person: 민규');
-                                      setEditingSalary({ ...selectedSalary, index: fullArrayIndex });
-                                      setShowEditModal(true);
-                                    } else {
-                                      // If we still can't find the data, show an error
-                                      console.error('Could not find salary data in full array for', month, '민규');
-                                    }
-                                  } catch (error) {
-                                    console.error('Error fetching all salaries:', error);
-                                  }
-                                } else {
-                                  console.error('Could not find salary data for', month, '민규');
-                                }
+                                openSalaryEditor(month, '민규', ['보너스', '월급']);
                               }}
                             >
                               {/* Bonus segment (transparent) */}
@@ -813,7 +842,7 @@ function Stats() {
                                 pointerEvents: 'none'
                               }}
                             >
-                              {formatCurrency(data.하영.total)} ({formatCurrency(data.하영.bonus)}/{formatCurrency(data.하영.salary)})
+                              {data.하영.tooltip}
                             </div>
                             {/* HaYoung stacked bar: salary (opaque) + bonus (transparent) */}
                             <div
@@ -826,137 +855,20 @@ function Stats() {
                                 transition: 'height 0.3s ease',
                                 cursor: 'pointer'
                               }}
-                              onMouseEnter={() => {
-                                console.log('Mouse entered haYoung bar for month:', month);
-                                setHoveredBar(`${month}-haYoung`);
-                              }}
-                              onMouseLeave={() => {
-                                console.log('Mouse left haYoung bar for month:', month);
-                                setHoveredBar(null);
-                              }}
-                              onMouseMove={(e) => {
-                                console.log('Mouse moved over haYoung bar for month:', month, '- coordinates:', e.clientX, e.clientY);
-                              }}
-                              onClick={async (e) => {
+                              onMouseEnter={() => setHoveredBar(`${month}-haYoung`)}
+                              onMouseLeave={() => setHoveredBar(null)}
+                              onClick={(e) => {
                                 // Determine which segment was clicked based on position
                                 const rect = e.currentTarget.getBoundingClientRect();
                                 const clickY = e.clientY - rect.top;
                                 const isBonusClicked = clickY < haYoungBonusHeight;
-
-                                // Find the appropriate salary data based on which segment was clicked
-                                // We need to find the correct index in the original salaries array
-                                let salaryIndex = -1;
-                                for (let i = 0; i < salaries.length; i++) {
-                                  const s = salaries[i];
-                                  if (s.month === month && s.person === '하영') {
-                                    if (isBonusClicked && s.classification === '보너스') {
-                                      salaryIndex = i;
-                                      break;
-                                    } else if (!isBonusClicked && (s.classification === undefined || s.classification === '월급')) {
-                                      salaryIndex = i;
-                                      break;
-                                    }
-                                  }
-                                }
-
-                                if (salaryIndex !== -1) {
-                                  // Get the actual salary data from the filtered array
-                                  const selectedSalary = salaries[salaryIndex];
-
-                                  // Now we need to find the index of this salary in the full array
-                                  // Fetch all salaries to get the full array
-                                  try {
-                                    const allSalariesResponse = await statsApi.getSalaries();
-                                    const allSalaries = allSalariesResponse.data;
-
-                                    // Find the index in the full array that matches our selected salary
-                                    let fullArrayIndex = -1;
-                                    for (let i = 0; i < allSalaries.length; i++) {
-                                      const s = allSalaries[i];
-                                      if (s.month === selectedSalary.month &&
-                                        s.person === selectedSalary.person &&
-                                        s.amount === selectedSalary.amount &&
-                                        s.classification === selectedSalary.classification) {
-                                        fullArrayIndex = i;
-                                        break;
-                                      }
-                                    }
-
-                                    if (fullArrayIndex !== -1) {
-                                      console.log('Clicked on salary data at index:', fullArrayIndex, 'in full array for month:', month, 'person: 하영', 'classification:', isBonusClicked ? '보너스' : '월급');
-                                      setEditingSalary({ ...selectedSalary, index: fullArrayIndex });
-                                      setShowEditModal(true);
-                                    } else {
-                                      // If we still can't find the data, show an error
-                                      console.error('Could not find salary data in full array for', month, '하영', isBonusClicked ? '보너스' : '월급');
-                                    }
-                                  } catch (error) {
-                                    console.error('Error fetching all salaries:', error);
-                                  }
-                                } else {
-                                  console.error('Could not find salary data for', month, '하영');
-                                }
+                                openSalaryEditor(month, '하영', [isBonusClicked ? '보너스' : '월급']);
                               }}
-                              onContextMenu={async (e) => {
+                              onContextMenu={(e) => {
                                 // For mobile long-press, we'll use context menu as a workaround
                                 e.preventDefault();
                                 // Try to find a bonus entry first, then fall back to regular salary
-                                let salaryIndex = -1;
-                                // Try to find a bonus entry first
-                                for (let i = 0; i < salaries.length; i++) {
-                                  const s = salaries[i];
-                                  if (s.month === month && s.person === '하영' && s.classification === '보너스') {
-                                    salaryIndex = i;
-                                    break;
-                                  }
-                                }
-                                if (salaryIndex === -1) {
-                                  // Fall back to regular salary
-                                  for (let i = 0; i < salaries.length; i++) {
-                                    const s = salaries[i];
-                                    if (s.month === month && s.person === '하영' && (s.classification === undefined || s.classification === '월급')) {
-                                      salaryIndex = i;
-                                      break;
-                                    }
-                                  }
-                                }
-                                if (salaryIndex !== -1) {
-                                  // Get the actual salary data from the filtered array
-                                  const selectedSalary = salaries[salaryIndex];
-
-                                  // Now we need to find the index of this salary in the full array
-                                  // Fetch all salaries to get the full array
-                                  try {
-                                    const allSalariesResponse = await statsApi.getSalaries();
-                                    const allSalaries = allSalariesResponse.data;
-
-                                    // Find the index in the full array that matches our selected salary
-                                    let fullArrayIndex = -1;
-                                    for (let i = 0; i < allSalaries.length; i++) {
-                                      const s = allSalaries[i];
-                                      if (s.month === selectedSalary.month &&
-                                        s.person === selectedSalary.person &&
-                                        s.amount === selectedSalary.amount &&
-                                        s.classification === selectedSalary.classification) {
-                                        fullArrayIndex = i;
-                                        break;
-                                      }
-                                    }
-
-                                    if (fullArrayIndex !== -1) {
-                                      console.log('Clicked on salary data at index:', fullArrayIndex, 'in full array for month:', month, 'person: 하영');
-                                      setEditingSalary({ ...selectedSalary, index: fullArrayIndex });
-                                      setShowEditModal(true);
-                                    } else {
-                                      // If we still can't find the data, show an error
-                                      console.error('Could not find salary data in full array for', month, '하영');
-                                    }
-                                  } catch (error) {
-                                    console.error('Error fetching all salaries:', error);
-                                  }
-                                } else {
-                                  console.error('Could not find salary data for', month, '하영');
-                                }
+                                openSalaryEditor(month, '하영', ['보너스', '월급']);
                               }}
                             >
                               {/* Bonus segment (transparent) */}
@@ -1038,7 +950,7 @@ function Stats() {
     try {
       await statsApi.updateSalary(updatedSalary.index, updatedSalary.amount, updatedSalary.month, updatedSalary.person, updatedSalary.classification);
       // Refresh the data
-      fetchStats();
+      refreshStats();
       // Close the modal
       setShowEditModal(false);
       setEditingSalary(null);
@@ -1055,7 +967,7 @@ function Stats() {
     try {
       await statsApi.deleteSalary(editingSalary.index);
       // Refresh the data
-      fetchStats();
+      refreshStats();
       // Close the modal
       setShowEditModal(false);
       setEditingSalary(null);
@@ -1065,9 +977,6 @@ function Stats() {
     }
   };
 
-  const currentYear = new Date().getFullYear();
-  const years = Array.from({ length: 10 }, (_, i) => (currentYear - 5 + i).toString());
-
   return (
     <StatsContainer>
       <div className="stats-header">
@@ -125,10 +125,14 @@ export const statsApi = {
   getAssetAllocation: () => api.get('/stats/asset-allocation'),
 };
 
+// Shared formatter: same output as amount.toLocaleString(), without building
+// a new Intl.NumberFormat on every call (formatCurrency runs once per table row)
+const numberFormatter = new Intl.NumberFormat();
+
 // Utility function to format currency
 export const formatCurrency = (amount) => {
   if (amount === undefined || amount === null) return '₩0';
-  return `₩${amount.toLocaleString()}`;
+  return `₩${numberFormatter.format(amount)}`;
 };
 
 // Utility function to get text color based on background